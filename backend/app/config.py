@@ -67,6 +67,10 @@ class Settings(BaseSettings):
     eth_rpc_ws_url: str | None = None
     bsc_rpc_url: str = "https://bsc-dataseed.binance.org/"
     bsc_rpc_ws_url: str | None = None
+    # SQLite file persisting ERC20 symbol/decimals across restarts (None = memory only).
+    # Relative paths resolve against the working directory; docker-compose sets an
+    # absolute path on the whale_monitor's token_cache_data volume
+    token_cache_path: str | None = "data/token_meta.sqlite3"
 
     # Subscription & Payments
     stripe_secret_key: str | None = None
@@ -284,9 +284,10 @@ def get_circuit_breaker(service_name: str) -> CircuitBreaker:
         CircuitBreaker instance
     """
     service_name = service_name.lower()
-    if service_name not in _breakers:
-        _breakers[service_name] = CircuitBreaker(service_name)
-    return _breakers[service_name]
+    breaker = _breakers.get(service_name)
+    if breaker is None:
+        breaker = _breakers[service_name] = CircuitBreaker(service_name)
+    return breaker
 
 
 def check_circuit(service_name: str) -> bool:
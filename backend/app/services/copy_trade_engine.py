@@ -10,9 +10,10 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
-from sqlalchemy import select, update
+from sqlalchemy import inspect, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import selectinload
 
 from app.config import SUBSCRIPTION_TIERS
 from app.database import get_db_context
@@ -64,6 +65,8 @@ class CopyTradeEngine:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.encryption = get_encryption_manager()
+        # whale_id -> whale name, shared by all followers of a signal
+        self._whale_names: dict[int, str] = {}
 
     async def process_signal(
         self,
@@ -552,12 +555,8 @@ class CopyTradeEngine:
             try:
                 if settings and settings.notify_trade_executed:
                     from app.workers.tasks.notification_tasks import send_trade_notification
-                    from app.models.whale import Whale
 
-                    whale_result = await self.db.execute(
-                        select(Whale).where(Whale.id == signal.whale_id)
-                    )
-                    whale = whale_result.scalar_one_or_none()
+                    whale_name = await self._get_whale_name(signal)
 
                     send_trade_notification.delay(
                         user_id=user.id,
@@ -568,7 +567,7 @@ class CopyTradeEngine:
                             "price": float(order_result.avg_fill_price),
                             "value_usdt": float(trade_size_usdt),
                             "status": "FILLED",
-                            "whale_name": whale.name if whale else "",
+                            "whale_name": whale_name,
                         }
                     )
                     logger.info(f"Sent trade notification to user {user.id} for trade {trade.id}")
@@ -687,6 +686,25 @@ class CopyTradeEngine:
 
         return False
 
+    async def _get_whale_name(self, signal: WhaleSignal) -> str:
+        """Get the signal's whale name, loading it at most once per engine."""
+        if signal.whale_id in self._whale_names:
+            return self._whale_names[signal.whale_id]
+
+        # Use the eagerly loaded relationship when present (no extra round trip)
+        if "whale" not in inspect(signal).unloaded:
+            whale = signal.whale
+        else:
+            from app.models.whale import Whale
+
+            whale_result = await self.db.execute(
+                select(Whale).where(Whale.id == signal.whale_id)
+            )
+            whale = whale_result.scalar_one_or_none()
+
+        self._whale_names[signal.whale_id] = whale.name if whale else ""
+        return self._whale_names[signal.whale_id]
+
     async def _get_user_api_key(
         self,
         user_id: int,
@@ -781,9 +799,12 @@ async def process_signal_async(
         List of copy trade results
     """
     async with get_db_context() as db:
-        # Get the signal
+        # Get the signal with its whale so per-follower notifications
+        # don't each re-query it
         result = await db.execute(
-            select(WhaleSignal).where(WhaleSignal.id == signal_id)
+            select(WhaleSignal)
+            .options(selectinload(WhaleSignal.whale))
+            .where(WhaleSignal.id == signal_id)
         )
         signal = result.scalar_one_or_none()
 
@@ -2,6 +2,8 @@
 DEX Transaction Parsers
 """
 
+from app.services.dex_parsers._base import SwapInfo, V2RouterParser
+from app.services.dex_parsers._registry import RouterRegistry
 from app.services.dex_parsers.uniswap import UniswapParser
 from app.services.dex_parsers.pancakeswap import PancakeSwapParser
 from app.services.dex_parsers.sushiswap import SushiSwapParser
@@ -10,4 +12,7 @@ __all__ = [
     "UniswapParser",
     "PancakeSwapParser",
     "SushiSwapParser",
+    "RouterRegistry",
+    "SwapInfo",
+    "V2RouterParser",
 ]
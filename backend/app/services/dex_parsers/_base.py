@@ -0,0 +1,398 @@
+"""
+Shared V2 Router Parser Base
+Common SwapInfo and Uniswap V2-style decoding used by PancakeSwap and SushiSwap
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Callable, ClassVar, Iterable
+
+from eth_abi.exceptions import DecodingError
+from web3 import AsyncWeb3
+
+from app.services.dex_parsers._calldata import (
+    ARGS_START,
+    WORD_HEX,
+    intern_address,
+    read_address_array,
+    read_word,
+)
+from app.services.dex_parsers._token_cache import TokenMetadataCache, get_token_cache
+from app.services.dex_parsers._tokens import NO_STABLECOINS, STABLECOINS_BY_CHAIN
+
+# Standard Uniswap V2-style method signatures
+V2_SWAP_SIGNATURES = {
+    "0x7ff36ab5": "swapExactETHForTokens",
+    "0x18cbafe5": "swapExactTokensForETH",
+    "0x38ed1739": "swapExactTokensForTokens",
+    "0x8803dbee": "swapTokensForExactTokens",
+    "0xfb3bdb41": "swapETHForExactTokens",
+    "0x4a25d94a": "swapTokensForExactETH",
+}
+
+# Selector -> (decode, parse, token extractor) method names for the V2 swaps we decode
+V2_HANDLERS = {
+    "0x7ff36ab5": ("_decode_eth_for_tokens", "_parse_eth_for_tokens", "_eth_for_tokens_tokens"),
+    "0x18cbafe5": ("_decode_tokens_for_x", "_parse_tokens_for_eth", "_tokens_for_x_tokens"),
+    "0x38ed1739": ("_decode_tokens_for_x", "_parse_tokens_for_tokens", "_tokens_for_x_tokens"),
+}
+
+# Selector -> minimum calldata length in hex chars (head words + path length + 2-hop path)
+V2_MIN_CALLDATA_LEN = {
+    "0x7ff36ab5": ARGS_START + WORD_HEX * (4 + 1 + 2),
+    "0x18cbafe5": ARGS_START + WORD_HEX * (5 + 1 + 2),
+    "0x38ed1739": ARGS_START + WORD_HEX * (5 + 1 + 2),
+}
+
+# Errors raised by malformed calldata
+CALLDATA_ERRORS = (ValueError, IndexError, DecodingError)
+
+# (method name, decode function, parse function, token extractor, minimum calldata length)
+_Handler = tuple[str, Callable[..., tuple], Callable[..., "SwapInfo"], Callable[..., tuple[str, ...]], int]
+
+# USD values are kept as integer micro-dollars until serialized
+USD_DECIMALS = 6
+USD_SCALE = 10 ** USD_DECIMALS
+
+
+def to_amount(raw: int, decimals: int) -> Decimal:
+    """Convert a raw integer token amount to units by shifting the exponent (no division)."""
+    return Decimal(raw).scaleb(-decimals)
+
+
+def to_usd_micro(price: Decimal) -> int:
+    """Convert a USD price to integer micro-dollars."""
+    return int(price.scaleb(USD_DECIMALS))
+
+
+@dataclass(slots=True, frozen=True)
+class SwapInfo:
+    """
+    Parsed swap transaction information.
+
+    Amounts are stored as raw integers; the Decimal views are only
+    materialized when a consumer reads them.
+    """
+
+    dex: str
+    action: str  # BUY or SELL
+    token_in: str
+    token_in_address: str
+    token_in_amount_raw: int
+    decimals_in: int
+    token_out: str
+    token_out_address: str
+    token_out_amount_raw: int
+    decimals_out: int
+    amount_usd_micro: int
+    router_address: str
+    method: str
+    chain: str = ""
+
+    @property
+    def token_in_amount(self) -> Decimal:
+        """Input amount in token units."""
+        return to_amount(self.token_in_amount_raw, self.decimals_in)
+
+    @property
+    def token_out_amount(self) -> Decimal:
+        """(Minimum) output amount in token units."""
+        return to_amount(self.token_out_amount_raw, self.decimals_out)
+
+    @property
+    def amount_usd(self) -> Decimal:
+        """USD value of the input amount."""
+        return to_amount(self.amount_usd_micro, USD_DECIMALS)
+
+
+class V2RouterParser:
+    """
+    Base parser for Uniswap V2-style routers.
+
+    Subclasses set the DEX name, the router -> signatures map and the
+    selector -> handler table; dispatch and V2 decoding live here.
+
+    Each swap is decoded once into its argument tuple; the token addresses
+    and the SwapInfo are both read from that tuple.
+    """
+
+    dex: ClassVar[str] = ""
+    swap_signatures: ClassVar[dict[str, str]] = V2_SWAP_SIGNATURES
+    handlers: ClassVar[dict[str, tuple[str, str, str]]] = V2_HANDLERS
+    min_calldata_len: ClassVar[dict[str, int]] = V2_MIN_CALLDATA_LEN
+    default_native_price: ClassVar[Decimal] = Decimal("2000")
+
+    # Built from `handlers` for each subclass: selector bytes ->
+    # (method name, decode function, parse function, token extractor, minimum calldata length)
+    _dispatch: ClassVar[dict[bytes, _Handler]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = {
+            bytes.fromhex(sig[2:]): (
+                cls.swap_signatures[sig],
+                getattr(cls, decode_name),
+                getattr(cls, parse_name),
+                getattr(cls, tokens_name),
+                cls.min_calldata_len.get(sig, ARGS_START),
+            )
+            for sig, (decode_name, parse_name, tokens_name) in cls.handlers.items()
+        }
+
+    def __init__(
+        self,
+        web3: AsyncWeb3,
+        chain: str,
+        native_symbol: str,
+        wrapped_native: str,
+        router_sigs: dict[str, dict[str, str]],
+        token_prices: dict[str, Decimal] | None = None,
+        cache: TokenMetadataCache | None = None,
+    ):
+        """
+        Initialize the parser.
+
+        Args:
+            web3: AsyncWeb3 instance for the target chain
+            chain: Chain name (ethereum, bsc, polygon, arbitrum)
+            native_symbol: Native currency symbol (ETH, BNB, ...)
+            wrapped_native: Wrapped native token address
+            router_sigs: Router address -> method signatures it accepts
+            token_prices: Optional dict of token address -> USD price
+            cache: Token metadata cache (defaults to the shared process-wide cache)
+        """
+        self.web3 = web3
+        self.chain = chain
+        self.native_symbol = native_symbol
+        self.wrapped_native = wrapped_native.lower()
+        self.router_sigs = {router.lower(): sigs for router, sigs in router_sigs.items() if router}
+        self.token_prices = token_prices or {}
+        self.prices_micro = {token.lower(): to_usd_micro(price) for token, price in self.token_prices.items()}
+        self.native_price_micro = self.prices_micro.get(
+            self.wrapped_native, to_usd_micro(self.default_native_price)
+        )
+        self.stablecoins = STABLECOINS_BY_CHAIN.get(chain, NO_STABLECOINS)
+
+        self.cache = cache or get_token_cache()
+
+    @property
+    def routers(self) -> frozenset[str]:
+        """Router addresses handled by this parser (lowercase)."""
+        return frozenset(self.router_sigs)
+
+    def is_swap_transaction(self, tx: dict[str, Any]) -> bool:
+        """Check if a transaction is a swap on one of this DEX's routers."""
+        to_address = tx.get("to", "").lower()
+        input_data = tx.get("input", "")
+
+        sigs = self.router_sigs.get(to_address)
+        if sigs is None:
+            return False
+
+        if len(input_data) < 10:
+            return False
+
+        method_sig = input_data[:10]
+        return method_sig in sigs
+
+    def parse_transaction(self, tx: dict[str, Any]) -> SwapInfo | None:
+        """
+        Parse a router transaction.
+
+        Token metadata is read from the cache only; use parse_block to
+        fetch it for uncached tokens first.
+
+        Args:
+            tx: Transaction data from web3
+
+        Returns:
+            SwapInfo if successfully parsed, None otherwise
+        """
+        decoded = self._decode(tx)
+        if decoded is None:
+            return None
+        return self._build(tx, decoded)
+
+    async def parse_block(self, txs: Iterable[dict[str, Any]]) -> list[tuple[dict[str, Any], SwapInfo]]:
+        """
+        Parse all swaps in a block's transactions.
+
+        Decodes every candidate once, fetches the metadata for all their
+        tokens in one awaited prefetch, then builds the SwapInfo objects
+        from the warm cache.
+
+        Args:
+            txs: Full transaction dicts from web3 (e.g. get_block(..., True))
+
+        Returns:
+            (transaction, SwapInfo) pairs in transaction order
+        """
+        candidates = [(tx, decoded) for tx in txs if (decoded := self._decode(tx)) is not None]
+        if not candidates:
+            return []
+
+        await self.prefetch_token_metadata(
+            address for _, decoded in candidates for address in self._swap_tokens(decoded)
+        )
+
+        return [(tx, swap) for tx, decoded in candidates if (swap := self._build(tx, decoded)) is not None]
+
+    def _decode(self, tx: dict[str, Any]) -> tuple[_Handler, tuple] | None:
+        """Decode a swap's arguments, returning (handler, decoded args)."""
+        if not self.is_swap_transaction(tx):
+            return None
+
+        input_data = tx.get("input", "")
+
+        try:
+            handler = self._dispatch.get(bytes.fromhex(input_data[2:10]))
+        except ValueError:
+            return None
+
+        if handler is None:
+            return None
+
+        # Reject truncated calldata before decoding anything
+        if len(input_data) < handler[4]:
+            return None
+
+        try:
+            return handler, handler[1](self, input_data)
+        except CALLDATA_ERRORS:
+            return None
+
+    def _build(self, tx: dict[str, Any], decoded: tuple[_Handler, tuple]) -> SwapInfo | None:
+        """Build SwapInfo from a decoded swap."""
+        (method_name, _, parse, _, _), args = decoded
+        try:
+            return parse(self, tx, method_name, args)
+        except CALLDATA_ERRORS:
+            return None
+
+    def _swap_tokens(self, decoded: tuple[_Handler, tuple]) -> tuple[str, ...]:
+        """Token addresses of a decoded swap (empty for a malformed path)."""
+        handler, args = decoded
+        try:
+            return handler[3](self, args)
+        except IndexError:
+            return ()
+
+    def _decode_eth_for_tokens(self, input_data: str) -> tuple:
+        """Decode native -> Tokens arguments."""
+        # (uint amountOutMin, address[] path, address to, uint deadline)
+        return read_word(input_data, 0), read_address_array(input_data, 1)
+
+    def _decode_tokens_for_x(self, input_data: str) -> tuple:
+        """Decode Tokens -> native/Tokens arguments."""
+        # (uint amountIn, uint amountOutMin, address[] path, address to, uint deadline)
+        return read_word(input_data, 0), read_word(input_data, 1), read_address_array(input_data, 2)
+
+    def _eth_for_tokens_tokens(self, args: tuple) -> tuple[str, ...]:
+        """Tokens touched by native -> Tokens (path end)."""
+        return (args[1][-1],)
+
+    def _tokens_for_x_tokens(self, args: tuple) -> tuple[str, ...]:
+        """Tokens touched by Tokens -> native/Tokens (path ends)."""
+        return (args[2][0], args[2][-1])
+
+    def _parse_eth_for_tokens(self, tx: dict[str, Any], method_name: str, args: tuple) -> SwapInfo:
+        """Parse native -> Tokens."""
+        amount_out_min, path = args
+
+        amount_in = tx.get("value", 0)
+
+        return SwapInfo(
+            dex=self.dex,
+            action="BUY",
+            token_in=self.native_symbol,
+            token_in_address=self.wrapped_native,
+            token_in_amount_raw=amount_in,
+            decimals_in=18,
+            token_out=self._get_token_symbol(path[-1]),
+            token_out_address=path[-1],
+            token_out_amount_raw=amount_out_min,
+            decimals_out=18,
+            amount_usd_micro=self._calculate_usd_value(self.native_symbol, amount_in, 18),
+            router_address=intern_address(tx.get("to", "")),
+            method=method_name,
+            chain=self.chain,
+        )
+
+    def _parse_tokens_for_eth(self, tx: dict[str, Any], method_name: str, args: tuple) -> SwapInfo:
+        """Parse Tokens -> native."""
+        amount_in, amount_out_min, path = args
+
+        token_in_addr = path[0]
+        decimals = self._get_token_decimals(token_in_addr)
+
+        return SwapInfo(
+            dex=self.dex,
+            action="SELL",
+            token_in=self._get_token_symbol(token_in_addr),
+            token_in_address=token_in_addr,
+            token_in_amount_raw=amount_in,
+            decimals_in=decimals,
+            token_out=self.native_symbol,
+            token_out_address=self.wrapped_native,
+            token_out_amount_raw=amount_out_min,
+            decimals_out=18,
+            amount_usd_micro=self._calculate_usd_value(token_in_addr, amount_in, decimals),
+            router_address=intern_address(tx.get("to", "")),
+            method=method_name,
+            chain=self.chain,
+        )
+
+    def _parse_tokens_for_tokens(self, tx: dict[str, Any], method_name: str, args: tuple) -> SwapInfo:
+        """Parse Tokens -> Tokens."""
+        amount_in, amount_out_min, path = args
+
+        token_in_addr = path[0]
+        token_out_addr = path[-1]
+
+        decimals_in = self._get_token_decimals(token_in_addr)
+        decimals_out = self._get_token_decimals(token_out_addr)
+
+        action = "BUY" if self._is_stablecoin(token_in_addr) else "SELL"
+
+        return SwapInfo(
+            dex=self.dex,
+            action=action,
+            token_in=self._get_token_symbol(token_in_addr),
+            token_in_address=token_in_addr,
+            token_in_amount_raw=amount_in,
+            decimals_in=decimals_in,
+            token_out=self._get_token_symbol(token_out_addr),
+            token_out_address=token_out_addr,
+            token_out_amount_raw=amount_out_min,
+            decimals_out=decimals_out,
+            amount_usd_micro=self._calculate_usd_value(token_in_addr, amount_in, decimals_in),
+            router_address=intern_address(tx.get("to", "")),
+            method=method_name,
+            chain=self.chain,
+        )
+
+    async def prefetch_token_metadata(self, addresses: Iterable[str]) -> None:
+        """Load symbol/decimals for uncached tokens ahead of parsing."""
+        await self.cache.prefetch(self.web3, self.chain, addresses)
+
+    def _get_token_symbol(self, address: str) -> str:
+        """Get token symbol from address."""
+        return self.cache.get_symbol(self.chain, address)
+
+    def _get_token_decimals(self, address: str) -> int:
+        """Get token decimals from address."""
+        return self.cache.get_decimals(self.chain, address)
+
+    def _is_stablecoin(self, address: str) -> bool:
+        """Check if address is a stablecoin."""
+        return address.lower() in self.stablecoins
+
+    def _calculate_usd_value(self, token: str, amount_raw: int, decimals: int) -> int:
+        """Calculate USD value (micro-dollars) of a raw token amount."""
+        if token.upper() in [self.native_symbol, f"W{self.native_symbol}"]:
+            price_micro = self.native_price_micro
+        elif self._is_stablecoin(token):
+            price_micro = USD_SCALE
+        else:
+            price_micro = self.prices_micro.get(token.lower(), 0)
+        return amount_raw * price_micro // 10 ** decimals
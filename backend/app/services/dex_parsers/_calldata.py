@@ -0,0 +1,89 @@
+"""
+Calldata Readers
+Read ABI-encoded words straight from the 0x-prefixed hex input string
+"""
+
+import sys
+from typing import Any, Callable
+
+from eth_abi.decoding import ContextFramesBytesIO, TupleDecoder
+from eth_abi.registry import registry as abi_registry
+
+# Hex offset of the first argument word (after "0x" + 4-byte selector)
+ARGS_START = 10
+
+# Hex characters per 32-byte ABI word
+WORD_HEX = 64
+
+# Lowercase address -> its interned instance (the token/router vocabulary is small)
+_ADDRESS_INTERN: dict[str, str] = {}
+
+
+def intern_address(address: str) -> str:
+    """Lowercase an address and return the shared interned instance."""
+    address = address.lower()
+    interned = _ADDRESS_INTERN.get(address)
+    if interned is None:
+        interned = _ADDRESS_INTERN.setdefault(address, sys.intern(address))
+    return interned
+
+
+# Address string -> its 160-bit integer value
+_ADDRESS_INT: dict[str, int] = {}
+
+
+def address_int(address: str) -> int:
+    """
+    Integer value of a 0x-prefixed address (case-insensitive), memoized per string.
+
+    Raises:
+        ValueError: If the string is not hex
+    """
+    value = _ADDRESS_INT.get(address)
+    if value is None:
+        value = _ADDRESS_INT[intern_address(address)] = int(address, 16)
+    return value
+
+
+def build_decoder(*types: str) -> Callable[[bytes], tuple[Any, ...]]:
+    """
+    Build a reusable decoder for an ABI argument tuple.
+
+    eth_abi.decode() resolves the codec for every type string on each call;
+    resolving it once lets hot paths decode with just the stream walk.
+    This mirrors what ABICodec.decode() assembles per call.
+    """
+    decoder = TupleDecoder(decoders=tuple(abi_registry.get_decoder(t) for t in types))
+
+    def decode_args(data: bytes) -> tuple[Any, ...]:
+        return decoder(ContextFramesBytesIO(data))
+
+    return decode_args
+
+
+def read_word(input_data: str, index: int) -> int:
+    """Read the argument word at `index` as an unsigned integer."""
+    start = ARGS_START + index * WORD_HEX
+    word = input_data[start:start + WORD_HEX]
+    if len(word) != WORD_HEX:
+        raise ValueError(f"Calldata too short for word {index}")
+    return int(word, 16)
+
+
+def read_address(input_data: str, index: int) -> str:
+    """Read the argument word at `index` as a lowercase address."""
+    start = ARGS_START + index * WORD_HEX
+    word = input_data[start:start + WORD_HEX]
+    if len(word) != WORD_HEX:
+        raise ValueError(f"Calldata too short for word {index}")
+    return intern_address("0x" + word[24:])
+
+
+def read_address_array(input_data: str, index: int) -> list[str]:
+    """Read a dynamic `address[]` whose offset is stored at argument word `index`."""
+    offset, remainder = divmod(read_word(input_data, index), 32)
+    if remainder:
+        raise ValueError("Misaligned address[] offset")
+
+    length = read_word(input_data, offset)
+    return [read_address(input_data, offset + 1 + i) for i in range(length)]
@@ -0,0 +1,33 @@
+"""
+Swap Candidate Pre-filter
+Cheap router/selector check run over a whole batch of transactions before ABI decoding
+"""
+
+from typing import Any, Iterable
+
+
+class SwapPrefilter:
+    """
+    Filters transactions down to those sent to a known router with a swap selector.
+
+    Both checks are plain set membership on lowercased strings.
+    """
+
+    def __init__(self, routers: Iterable[str], selectors: Iterable[str]):
+        """
+        Initialize the pre-filter.
+
+        Args:
+            routers: Router addresses (any case)
+            selectors: 0x-prefixed 4-byte method selectors (any case)
+        """
+        self.routers = frozenset(r.lower() for r in routers if r)
+        self.selectors = frozenset(s.lower() for s in selectors)
+
+    def filter(self, txs: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return the transactions that may be DEX swaps."""
+        return [
+            tx for tx in txs
+            if (tx.get("to") or "").lower() in self.routers
+            and (tx.get("input") or "")[:10].lower() in self.selectors
+        ]
@@ -0,0 +1,97 @@
+"""
+Router Registry
+Maps router addresses to the parser that handles them on one chain
+"""
+
+import asyncio
+from typing import Any, Iterable, Protocol
+
+from app.services.dex_parsers._base import SwapInfo
+
+
+class DexParser(Protocol):
+    """Interface shared by all DEX parsers."""
+
+    swap_signatures: dict[str, str]
+
+    @property
+    def routers(self) -> frozenset[str]: ...
+
+    def parse_transaction(self, tx: dict[str, Any]) -> SwapInfo | None: ...
+
+    async def parse_block(self, txs: Iterable[dict[str, Any]]) -> list[tuple[dict[str, Any], SwapInfo]]: ...
+
+
+class RouterRegistry:
+    """
+    Lowercase router address -> parser lookup for a single chain.
+
+    One dict lookup both filters out non-DEX transactions and picks the
+    parser, instead of trying every parser's is_*_transaction in turn.
+    """
+
+    def __init__(self, parsers: Iterable[DexParser]):
+        """
+        Initialize the registry.
+
+        Args:
+            parsers: Parsers for the chain, in priority order
+        """
+        self._parsers: dict[str, DexParser] = {}
+        self._selectors: set[str] = set()
+
+        for parser in parsers:
+            self._selectors.update(parser.swap_signatures)
+            for router in parser.routers:
+                # First parser registered for a router wins
+                self._parsers.setdefault(router, parser)
+
+    @property
+    def routers(self) -> frozenset[str]:
+        """All registered router addresses (lowercase)."""
+        return frozenset(self._parsers)
+
+    @property
+    def selectors(self) -> frozenset[str]:
+        """All swap selectors understood by the registered parsers."""
+        return frozenset(self._selectors)
+
+    def get(self, to_address: str) -> DexParser | None:
+        """Get the parser for a router address."""
+        return self._parsers.get(to_address.lower())
+
+    async def parse_block(self, txs: Iterable[dict[str, Any]]) -> list[tuple[dict[str, Any], SwapInfo]]:
+        """
+        Parse a block's swaps with the parsers registered for their routers.
+
+        Each parser decodes its transactions once, awaits one token
+        metadata prefetch for all of them and builds from the warm cache.
+        The parsers run concurrently, so their prefetches overlap.
+
+        Returns:
+            (transaction, SwapInfo) pairs in block order
+        """
+        txs = list(txs)
+        by_parser: dict[DexParser, list[dict[str, Any]]] = {}
+        for tx in txs:
+            parser = self._parsers.get((tx.get("to") or "").lower())
+            if parser is not None:
+                by_parser.setdefault(parser, []).append(tx)
+
+        if not by_parser:
+            return []
+
+        results = await asyncio.gather(
+            *(parser.parse_block(parser_txs) for parser, parser_txs in by_parser.items())
+        )
+
+        # Restore block order across parsers
+        swaps = {id(tx): swap for result in results for tx, swap in result}
+        return [(tx, swaps[id(tx)]) for tx in txs if id(tx) in swaps]
+
+    def parse_transaction(self, tx: dict[str, Any]) -> SwapInfo | None:
+        """Parse a transaction with the parser registered for its `to` address."""
+        parser = self._parsers.get((tx.get("to") or "").lower())
+        if parser is None:
+            return None
+        return parser.parse_transaction(tx)
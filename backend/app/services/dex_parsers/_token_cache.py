@@ -0,0 +1,339 @@
+"""
+Shared Token Metadata Cache
+Process-wide cache of ERC20 symbol/decimals shared by all DEX parsers
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable
+
+import httpx
+import orjson
+from eth_abi.exceptions import DecodingError
+from eth_typing import ChecksumAddress
+from web3 import AsyncWeb3, Web3
+from web3.exceptions import ContractLogicError
+
+from app.config import get_settings
+from app.services.dex_parsers._calldata import build_decoder
+
+DEFAULT_DECIMALS = 18
+
+# ERC20 metadata selectors; symbol() and decimals() take no arguments,
+# so the selector is the complete calldata
+SYMBOL_SELECTOR = "0x95d89b41"
+DECIMALS_SELECTOR = "0x313ce567"
+
+# Timeout for a batched JSON-RPC metadata request (seconds)
+BATCH_TIMEOUT = 10.0
+
+# Max in-flight per-token eth_calls when the batch left calls unresolved
+# (often because the node is rate-limiting, so do not fan out unbounded)
+MAX_CONCURRENT_CALLS = 8
+
+# Errors raised decoding symbol()/decimals() return data (non-standard tokens)
+RETURN_DATA_ERRORS = (DecodingError, ValueError)
+
+# Prebuilt decoders for symbol()/decimals() return data
+_decode_string = build_decoder("string")
+_decode_uint8 = build_decoder("uint8")
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=65536)
+def to_checksum(address_lc: str) -> ChecksumAddress:
+    """Checksum a lowercase address (keccak256 per call, so memoized)."""
+    return Web3.to_checksum_address(address_lc)
+
+
+def _is_revert(error: Any) -> bool:
+    """Check whether a JSON-RPC error reply is a contract revert rather than a node error."""
+    if not isinstance(error, dict):
+        return False
+    return error.get("code") == 3 or "revert" in str(error.get("message", "")).lower()
+
+
+async def _eth_call(web3: AsyncWeb3, address_lc: str, calldata: str) -> bytes:
+    """Run a raw eth_call, skipping web3's contract/ABI machinery."""
+    return bytes(await web3.eth.call({"to": to_checksum(address_lc), "data": calldata}))
+
+
+class TokenMetadataCache:
+    """
+    Cache of token symbols and decimals keyed by (chain, lowercase address).
+
+    Parsers are re-created per worker/signal, so keeping metadata on the
+    parser instance means every new instance re-fetches it over RPC.
+    A single shared instance amortizes those calls across all parsers.
+
+    When a path is given, fetched metadata is also written through to a
+    SQLite table and read back on a memory miss, so restarts start warm.
+
+    Metadata is only fetched by the async prefetch(), awaited once per
+    block before its swaps are parsed; the get_* lookups used by the parse
+    code never touch the network.
+
+    Tokens whose lookup fails at the contract level (reverts, empty or
+    undecodable return data) are cached with the fallback value, in memory
+    only, so they do not hit RPC on every swap. Transport errors are never
+    cached, so a flaky node cannot pin a wrong value on a real token.
+    """
+
+    def __init__(self, path: str | None = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file for persistent metadata (None keeps it in memory only)
+        """
+        self._symbols: dict[tuple[str, str], str] = {}
+        self._decimals: dict[tuple[str, str], int] = {}
+
+        self._http: httpx.AsyncClient | None = None
+
+        self._db: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+        if path:
+            self._open_db(path)
+
+    def _open_db(self, path: str) -> None:
+        """Open (and create if needed) the persistent metadata table."""
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS token_meta ("
+                "chain TEXT NOT NULL, address TEXT NOT NULL, symbol TEXT, decimals INTEGER, "
+                "PRIMARY KEY (chain, address))"
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Token metadata disk cache disabled: {e}")
+            self._db = None
+
+    def _load(self, chain: str, address: str) -> None:
+        """Read-through: copy a persisted row into memory."""
+        if self._db is None:
+            return
+        try:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT symbol, decimals FROM token_meta WHERE chain = ? AND address = ?",
+                    (chain, address),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"Token metadata disk read failed: {e}")
+            return
+
+        if row is None:
+            return
+        symbol, decimals = row
+        if symbol is not None:
+            self._symbols.setdefault((chain, address), symbol)
+        if decimals is not None:
+            self._decimals.setdefault((chain, address), decimals)
+
+    def _store(self, chain: str, address: str, symbol: str | None = None, decimals: int | None = None) -> None:
+        """Write-through: persist a freshly fetched value."""
+        if self._db is None:
+            return
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    "INSERT INTO token_meta (chain, address, symbol, decimals) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (chain, address) DO UPDATE SET "
+                    "symbol = COALESCE(excluded.symbol, symbol), "
+                    "decimals = COALESCE(excluded.decimals, decimals)",
+                    (chain, address, symbol, decimals),
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"Token metadata disk write failed: {e}")
+
+    def seed(
+        self,
+        chain: str,
+        symbols: dict[str, str] | None = None,
+        decimals: dict[str, int] | None = None,
+    ) -> None:
+        """
+        Pre-populate well-known tokens for a chain.
+
+        Args:
+            chain: Chain name (ethereum, bsc, polygon, arbitrum)
+            symbols: Dict of token address -> symbol
+            decimals: Dict of token address -> decimals
+        """
+        for address, symbol in (symbols or {}).items():
+            self._symbols.setdefault((chain, address.lower()), symbol)
+        for address, value in (decimals or {}).items():
+            self._decimals.setdefault((chain, address.lower()), value)
+
+    async def prefetch(self, web3: AsyncWeb3, chain: str, addresses: Iterable[str]) -> None:
+        """
+        Fetch symbol/decimals for all uncached addresses.
+
+        Uses one JSON-RPC batch when the provider has an HTTP endpoint;
+        anything the batch did not resolve (websocket providers, failed
+        batches) is fetched with at most MAX_CONCURRENT_CALLS eth_calls
+        in flight.
+
+        Args:
+            web3: AsyncWeb3 instance for the target chain
+            chain: Chain name (ethereum, bsc, polygon, arbitrum)
+            addresses: Token addresses (any case)
+        """
+        calls: list[tuple[str, str]] = []
+        for address in dict.fromkeys(a.lower() for a in addresses if a):
+            if (chain, address) not in self._symbols or (chain, address) not in self._decimals:
+                self._load(chain, address)
+            if (chain, address) not in self._symbols:
+                calls.append((SYMBOL_SELECTOR, address))
+            if (chain, address) not in self._decimals:
+                calls.append((DECIMALS_SELECTOR, address))
+        if not calls:
+            return
+
+        endpoint = str(getattr(web3.provider, "endpoint_uri", None) or "")
+        if endpoint.startswith(("http://", "https://")):
+            await self._fetch_batch(endpoint, chain, calls)
+
+        remaining = [(selector, address) for selector, address in calls if not self._has(chain, selector, address)]
+        if remaining:
+            limit = asyncio.Semaphore(MAX_CONCURRENT_CALLS)
+            await asyncio.gather(
+                *(self._fetch_one(web3, chain, selector, address, limit) for selector, address in remaining)
+            )
+
+    def _has(self, chain: str, selector: str, address: str) -> bool:
+        """Check whether the value a metadata call fetches is cached."""
+        cache = self._symbols if selector == SYMBOL_SELECTOR else self._decimals
+        return (chain, address) in cache
+
+    async def _fetch_batch(self, endpoint: str, chain: str, calls: list[tuple[str, str]]) -> None:
+        """Resolve metadata calls with a single JSON-RPC batch request."""
+        batch = [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "eth_call",
+                "params": [{"to": address, "data": selector}, "latest"],
+            }
+            for i, (selector, address) in enumerate(calls)
+        ]
+
+        if self._http is None:
+            self._http = httpx.AsyncClient(timeout=BATCH_TIMEOUT)
+
+        try:
+            response = await self._http.post(endpoint, json=batch)
+            response.raise_for_status()
+            replies = orjson.loads(response.content)
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            logger.debug(f"Token metadata batch failed: {e}")
+            return
+
+        if not isinstance(replies, list):
+            return
+
+        for reply in replies:
+            if not isinstance(reply, dict):
+                continue
+
+            call_id = reply.get("id")
+            if not isinstance(call_id, int) or not 0 <= call_id < len(calls):
+                continue
+
+            selector, address = calls[call_id]
+            error = reply.get("error")
+            if error is not None:
+                if _is_revert(error):
+                    self._set_failed(chain, selector, address)
+                # Other errors (rate limits, node trouble) are retried per call
+                continue
+
+            try:
+                data = bytes.fromhex(reply["result"][2:])
+            except (KeyError, TypeError, ValueError):
+                # Malformed reply; retried per call
+                continue
+            self._set(chain, selector, address, data)
+
+    async def _fetch_one(
+        self,
+        web3: AsyncWeb3,
+        chain: str,
+        selector: str,
+        address: str,
+        limit: asyncio.Semaphore,
+    ) -> None:
+        """Resolve a single metadata call with its own eth_call."""
+        try:
+            async with limit:
+                data = await _eth_call(web3, address, selector)
+        except ContractLogicError:
+            self._set_failed(chain, selector, address)
+            return
+        except Exception as e:
+            # Transport/node error: leave it uncached so the next block retries
+            logger.debug(f"Token metadata call failed for {address}: {e}")
+            return
+
+        self._set(chain, selector, address, data)
+
+    def _set(self, chain: str, selector: str, address: str, data: bytes) -> None:
+        """Decode a symbol()/decimals() return value, then cache and persist it."""
+        try:
+            if selector == SYMBOL_SELECTOR:
+                symbol = _decode_string(data)[0]
+            else:
+                decimals = _decode_uint8(data)[0]
+        except RETURN_DATA_ERRORS:
+            # Empty (no such function/not a contract) or non-standard (e.g. bytes32 symbol)
+            self._set_failed(chain, selector, address)
+            return
+
+        if selector == SYMBOL_SELECTOR:
+            self._symbols[(chain, address)] = symbol
+            self._store(chain, address, symbol=symbol)
+        else:
+            self._decimals[(chain, address)] = decimals
+            self._store(chain, address, decimals=decimals)
+
+    def _set_failed(self, chain: str, selector: str, address: str) -> None:
+        """Negative-cache a contract-level failure (memory only, so a restart retries it)."""
+        if selector == SYMBOL_SELECTOR:
+            self._symbols[(chain, address)] = address[:8] + "..."
+        else:
+            self._decimals[(chain, address)] = DEFAULT_DECIMALS
+
+    def get_symbol(self, chain: str, address: str) -> str:
+        """Get a cached token symbol (no RPC; uncached tokens get a shortened address)."""
+        address = address.lower()
+        key = (chain, address)
+        if key not in self._symbols:
+            self._load(chain, address)
+        return self._symbols.get(key, address[:8] + "...")
+
+    def get_decimals(self, chain: str, address: str) -> int:
+        """Get cached token decimals (no RPC; uncached tokens get the default)."""
+        address = address.lower()
+        key = (chain, address)
+        if key not in self._decimals:
+            self._load(chain, address)
+        return self._decimals.get(key, DEFAULT_DECIMALS)
+
+
+# Singleton instance
+_token_cache: TokenMetadataCache | None = None
+
+
+def get_token_cache() -> TokenMetadataCache:
+    """Get singleton TokenMetadataCache instance."""
+    global _token_cache
+    if _token_cache is None:
+        _token_cache = TokenMetadataCache(path=get_settings().token_cache_path)
+    return _token_cache
@@ -0,0 +1,22 @@
+"""
+Well-Known Token Registry
+Lowercased token addresses shared by the DEX parsers
+"""
+
+# Stablecoins per chain (lowercase addresses)
+STABLECOINS_BY_CHAIN: dict[str, frozenset[str]] = {
+    "ethereum": frozenset({
+        "0xdac17f958d2ee523a2206206994597c13d831ec7",  # USDT
+        "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48",  # USDC
+    }),
+    "bsc": frozenset({
+        "0x55d398326f99059ff775485246999027b3197955",  # USDT
+        "0xe9e7cea3dedca5984780bafc599bd69add087d56",  # BUSD
+    }),
+    "polygon": frozenset({
+        "0xc2132d05d31c914a87c6611c10748aeb04b58e8f",  # USDT
+        "0x2791bca1f2de4661ed88a30c99a7a9449aa84174",  # USDC
+    }),
+}
+
+NO_STABLECOINS: frozenset[str] = frozenset()
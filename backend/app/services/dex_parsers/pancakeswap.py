@@ -3,12 +3,20 @@ PancakeSwap V2/V3 Transaction Parser
 Parses swap transactions from PancakeSwap routers on BSC
 """
 
-from dataclasses import dataclass
 from decimal import Decimal
 from typing import Any
 
-from web3 import Web3
-from eth_abi import decode
+from web3 import AsyncWeb3
+
+from app.services.dex_parsers._base import (
+    V2_HANDLERS,
+    V2_MIN_CALLDATA_LEN,
+    V2_SWAP_SIGNATURES,
+    SwapInfo,
+    V2RouterParser,
+)
+from app.services.dex_parsers._calldata import ARGS_START, WORD_HEX, build_decoder, intern_address
+from app.services.dex_parsers._token_cache import TokenMetadataCache
 
 # PancakeSwap Router addresses (BSC)
 PANCAKE_V2_ROUTER = "0x10ED43C718714eb63d5aA57B78B54704E256024E"
@@ -19,234 +27,176 @@ WBNB = "0xbb4CdB9CBd36B01bD1cBaEBF2De08d9173bc095c"
 BUSD = "0xe9e7CEA3DedcA5984780Bafc599bD69ADd087D56"
 USDT_BSC = "0x55d398326f99059fF775485246999027B3197955"
 
-# Method signatures (same as Uniswap V2)
-SWAP_SIGNATURES = {
-    "0x7ff36ab5": "swapExactETHForTokens",
-    "0x18cbafe5": "swapExactTokensForETH",
-    "0x38ed1739": "swapExactTokensForTokens",
-    "0x8803dbee": "swapTokensForExactTokens",
-    "0xfb3bdb41": "swapETHForExactTokens",
-    "0x4a25d94a": "swapTokensForExactETH",
+# V2 router method signatures (same as Uniswap V2)
+V2_SIGS = {
+    **V2_SWAP_SIGNATURES,
     # PancakeSwap specific
     "0x5c11d795": "swapExactTokensForTokensSupportingFeeOnTransferTokens",
     "0xb6f9de95": "swapExactETHForTokensSupportingFeeOnTransferTokens",
     "0x791ac947": "swapExactTokensForETHSupportingFeeOnTransferTokens",
 }
 
+# V3 smart router method signatures (SwapRouter02 layouts, no deadline field)
+V3_SIGS = {
+    "0x04e45aaf": "exactInputSingle",
+    "0xb858183f": "exactInput",
+    "0x5023b4df": "exactOutputSingle",
+}
+
+# All known swap signatures
+SWAP_SIGNATURES = {**V2_SIGS, **V3_SIGS}
 
-@dataclass
-class SwapInfo:
-    """Parsed swap transaction information."""
+# Router address -> method signatures it accepts
+ROUTER_SIGS = {
+    PANCAKE_V2_ROUTER.lower(): V2_SIGS,
+    PANCAKE_V3_ROUTER.lower(): V3_SIGS,
+}
 
-    dex: str
-    action: str
-    token_in: str
-    token_in_address: str
-    token_in_amount: Decimal
-    token_out: str
-    token_out_address: str
-    token_out_amount: Decimal
-    amount_usd: Decimal
-    router_address: str
-    method: str
+# Prebuilt ABI decoders for the V3 argument layouts
+# (exactInputSingle and exactOutputSingle share the same 7-field struct)
+_decode_v3_single = build_decoder("address", "address", "uint24", "address", "uint256", "uint256", "uint160")
+_decode_v3_exact_input = build_decoder("(bytes,address,uint256,uint256)")
 
 
-class PancakeSwapParser:
+class PancakeSwapParser(V2RouterParser):
     """Parser for PancakeSwap V2 and V3 transactions on BSC."""
 
-    def __init__(self, web3: Web3, token_prices: dict[str, Decimal] | None = None):
+    dex = "pancakeswap_v2"
+    swap_signatures = SWAP_SIGNATURES
+    handlers = {
+        **V2_HANDLERS,
+        "0xb6f9de95": V2_HANDLERS["0x7ff36ab5"],
+        "0x791ac947": V2_HANDLERS["0x18cbafe5"],
+        "0x5c11d795": V2_HANDLERS["0x38ed1739"],
+        "0x04e45aaf": ("_decode_v3_single_args", "_parse_v3_exact_input_single", "_v3_single_tokens"),
+        "0xb858183f": ("_decode_v3_exact_input_args", "_parse_v3_exact_input", "_v3_exact_input_tokens"),
+        "0x5023b4df": ("_decode_v3_single_args", "_parse_v3_exact_output_single", "_v3_single_tokens"),
+    }
+    min_calldata_len = {
+        **V2_MIN_CALLDATA_LEN,
+        "0xb6f9de95": V2_MIN_CALLDATA_LEN["0x7ff36ab5"],
+        "0x791ac947": V2_MIN_CALLDATA_LEN["0x18cbafe5"],
+        "0x5c11d795": V2_MIN_CALLDATA_LEN["0x38ed1739"],
+        # 7 static struct words
+        "0x04e45aaf": ARGS_START + WORD_HEX * 7,
+        "0x5023b4df": ARGS_START + WORD_HEX * 7,
+        # tuple offset + 4 head words + bytes length + 43-byte single-hop path
+        "0xb858183f": ARGS_START + WORD_HEX * (1 + 4 + 1 + 2),
+    }
+    default_native_price = Decimal("300")
+
+    def __init__(
+        self,
+        web3: AsyncWeb3,
+        token_prices: dict[str, Decimal] | None = None,
+        cache: TokenMetadataCache | None = None,
+    ):
         """
         Initialize the parser.
 
         Args:
-            web3: Web3 instance connected to BSC
+            web3: AsyncWeb3 instance connected to BSC
             token_prices: Optional dict of token address -> USD price
+            cache: Token metadata cache (defaults to the shared process-wide cache)
         """
-        self.web3 = web3
-        self.token_prices = token_prices or {}
-
-        # Token symbol cache
-        self._token_symbols: dict[str, str] = {
-            WBNB.lower(): "WBNB",
-            BUSD.lower(): "BUSD",
-            USDT_BSC.lower(): "USDT",
-        }
+        super().__init__(
+            web3,
+            chain="bsc",
+            native_symbol="BNB",
+            wrapped_native=WBNB,
+            router_sigs=ROUTER_SIGS,
+            token_prices=token_prices,
+            cache=cache,
+        )
+
+        self.cache.seed(
+            self.chain,
+            symbols={WBNB: "WBNB", BUSD: "BUSD", USDT_BSC: "USDT"},
+            # USDT on BSC is 18 decimals unlike Ethereum
+            decimals={USDT_BSC: 18},
+        )
 
     def is_pancakeswap_transaction(self, tx: dict[str, Any]) -> bool:
         """Check if a transaction is a PancakeSwap swap."""
-        to_address = tx.get("to", "").lower()
-        input_data = tx.get("input", "")
-
-        routers = [
-            PANCAKE_V2_ROUTER.lower(),
-            PANCAKE_V3_ROUTER.lower(),
-        ]
-
-        if to_address not in routers:
-            return False
-
-        if len(input_data) < 10:
-            return False
-
-        method_sig = input_data[:10]
-        return method_sig in SWAP_SIGNATURES
-
-    def parse_transaction(self, tx: dict[str, Any]) -> SwapInfo | None:
-        """
-        Parse a PancakeSwap transaction.
-
-        Args:
-            tx: Transaction data from web3
-
-        Returns:
-            SwapInfo if successfully parsed, None otherwise
-        """
-        if not self.is_pancakeswap_transaction(tx):
-            return None
-
-        input_data = tx.get("input", "")
-        method_sig = input_data[:10]
-        method_name = SWAP_SIGNATURES.get(method_sig, "unknown")
-
-        to_address = tx.get("to", "").lower()
-        value = tx.get("value", 0)
-
-        try:
-            # ETH -> Tokens (BNB -> Tokens on BSC)
-            if method_name in ["swapExactETHForTokens", "swapExactETHForTokensSupportingFeeOnTransferTokens"]:
-                decoded = decode(
-                    ["uint256", "address[]", "address", "uint256"],
-                    bytes.fromhex(input_data[10:]),
-                )
-                amount_out_min = decoded[0]
-                path = decoded[1]
-
-                return SwapInfo(
-                    dex="pancakeswap_v2",
-                    action="BUY",
-                    token_in="BNB",
-                    token_in_address=WBNB,
-                    token_in_amount=Decimal(str(value)) / Decimal("1e18"),
-                    token_out=self._get_token_symbol(path[-1]),
-                    token_out_address=path[-1],
-                    token_out_amount=Decimal(str(amount_out_min)) / Decimal("1e18"),
-                    amount_usd=self._calculate_usd_value("BNB", Decimal(str(value)) / Decimal("1e18")),
-                    router_address=to_address,
-                    method=method_name,
-                )
-
-            # Tokens -> ETH (Tokens -> BNB on BSC)
-            elif method_name in ["swapExactTokensForETH", "swapExactTokensForETHSupportingFeeOnTransferTokens"]:
-                decoded = decode(
-                    ["uint256", "uint256", "address[]", "address", "uint256"],
-                    bytes.fromhex(input_data[10:]),
-                )
-                amount_in = decoded[0]
-                path = decoded[2]
-
-                token_in_addr = path[0]
-                decimals = self._get_token_decimals(token_in_addr)
-                amount_in_decimal = Decimal(str(amount_in)) / Decimal(f"1e{decimals}")
-
-                return SwapInfo(
-                    dex="pancakeswap_v2",
-                    action="SELL",
-                    token_in=self._get_token_symbol(token_in_addr),
-                    token_in_address=token_in_addr,
-                    token_in_amount=amount_in_decimal,
-                    token_out="BNB",
-                    token_out_address=WBNB,
-                    token_out_amount=Decimal(str(decoded[1])) / Decimal("1e18"),
-                    amount_usd=self._calculate_usd_value(token_in_addr, amount_in_decimal),
-                    router_address=to_address,
-                    method=method_name,
-                )
-
-            # Tokens -> Tokens
-            elif method_name in ["swapExactTokensForTokens", "swapExactTokensForTokensSupportingFeeOnTransferTokens"]:
-                decoded = decode(
-                    ["uint256", "uint256", "address[]", "address", "uint256"],
-                    bytes.fromhex(input_data[10:]),
-                )
-                amount_in = decoded[0]
-                path = decoded[2]
-
-                token_in_addr = path[0]
-                token_out_addr = path[-1]
-
-                decimals_in = self._get_token_decimals(token_in_addr)
-                decimals_out = self._get_token_decimals(token_out_addr)
-
-                amount_in_decimal = Decimal(str(amount_in)) / Decimal(f"1e{decimals_in}")
-
-                action = "BUY" if self._is_stablecoin(token_in_addr) else "SELL"
-
-                return SwapInfo(
-                    dex="pancakeswap_v2",
-                    action=action,
-                    token_in=self._get_token_symbol(token_in_addr),
-                    token_in_address=token_in_addr,
-                    token_in_amount=amount_in_decimal,
-                    token_out=self._get_token_symbol(token_out_addr),
-                    token_out_address=token_out_addr,
-                    token_out_amount=Decimal(str(decoded[1])) / Decimal(f"1e{decimals_out}"),
-                    amount_usd=self._calculate_usd_value(token_in_addr, amount_in_decimal),
-                    router_address=to_address,
-                    method=method_name,
-                )
-
-        except Exception:
-            pass
-
-        return None
-
-    def _get_token_symbol(self, address: str) -> str:
-        """Get token symbol from address."""
-        address = address.lower()
-        if address in self._token_symbols:
-            return self._token_symbols[address]
-
-        try:
-            contract = self.web3.eth.contract(
-                address=Web3.to_checksum_address(address),
-                abi=[{"constant": True, "inputs": [], "name": "symbol", "outputs": [{"name": "", "type": "string"}], "type": "function"}],
-            )
-            symbol = contract.functions.symbol().call()
-            self._token_symbols[address] = symbol
-            return symbol
-        except Exception:
-            return address[:8] + "..."
-
-    def _get_token_decimals(self, address: str) -> int:
-        """Get token decimals from address."""
-        address = address.lower()
-
-        # Known tokens with non-18 decimals
-        if address == USDT_BSC.lower():
-            return 18  # USDT on BSC is 18 decimals unlike Ethereum
-
-        try:
-            contract = self.web3.eth.contract(
-                address=Web3.to_checksum_address(address),
-                abi=[{"constant": True, "inputs": [], "name": "decimals", "outputs": [{"name": "", "type": "uint8"}], "type": "function"}],
-            )
-            return contract.functions.decimals().call()
-        except Exception:
-            return 18
-
-    def _is_stablecoin(self, address: str) -> bool:
-        """Check if address is a stablecoin."""
-        address = address.lower()
-        stablecoins = [BUSD.lower(), USDT_BSC.lower()]
-        return address in stablecoins
-
-    def _calculate_usd_value(self, token: str, amount: Decimal) -> Decimal:
-        """Calculate USD value of a token amount."""
-        if token.upper() in ["BNB", "WBNB"]:
-            bnb_price = self.token_prices.get(WBNB.lower(), Decimal("300"))
-            return amount * bnb_price
-        elif self._is_stablecoin(token):
-            return amount
-        else:
-            price = self.token_prices.get(token.lower(), Decimal("0"))
-            return amount * price
+        return self.is_swap_transaction(tx)
+
+    def _decode_v3_single_args(self, input_data: str) -> tuple:
+        """Decode the exactInputSingle/exactOutputSingle struct."""
+        # struct ExactInputSingleParams / ExactOutputSingleParams {
+        #     address tokenIn;
+        #     address tokenOut;
+        #     uint24 fee;
+        #     address recipient;
+        #     uint256 amountIn / amountOut;
+        #     uint256 amountOutMinimum / amountInMaximum;
+        #     uint160 sqrtPriceLimitX96;
+        # }
+        return _decode_v3_single(bytes.fromhex(input_data[10:]))
+
+    def _decode_v3_exact_input_args(self, input_data: str) -> tuple:
+        """Decode the exactInput (multi-hop) struct."""
+        # struct ExactInputParams {
+        #     bytes path;
+        #     address recipient;
+        #     uint256 amountIn;
+        #     uint256 amountOutMinimum;
+        # }
+        return _decode_v3_exact_input(bytes.fromhex(input_data[10:]))[0]
+
+    def _v3_single_tokens(self, decoded: tuple) -> tuple[str, ...]:
+        """Tokens touched by exactInputSingle/exactOutputSingle."""
+        return (intern_address(decoded[0]), intern_address(decoded[1]))
+
+    def _v3_exact_input_tokens(self, params: tuple) -> tuple[str, ...]:
+        """Tokens touched by exactInput (path ends)."""
+        # Path is tokenIn (20 bytes) + [fee (3 bytes) + token (20 bytes)]...
+        path = params[0]
+        return (intern_address("0x" + path[:20].hex()), intern_address("0x" + path[-20:].hex()))
+
+    def _parse_v3_exact_input_single(self, tx: dict[str, Any], method_name: str, decoded: tuple) -> SwapInfo:
+        """Parse V3 exactInputSingle."""
+        return self._build_v3_swap(tx, method_name, decoded[0], decoded[1], decoded[4], decoded[5])
+
+    def _parse_v3_exact_input(self, tx: dict[str, Any], method_name: str, params: tuple) -> SwapInfo:
+        """Parse V3 exactInput (multi-hop)."""
+        token_in_addr, token_out_addr = self._v3_exact_input_tokens(params)
+        return self._build_v3_swap(tx, method_name, token_in_addr, token_out_addr, params[2], params[3])
+
+    def _parse_v3_exact_output_single(self, tx: dict[str, Any], method_name: str, decoded: tuple) -> SwapInfo:
+        """Parse V3 exactOutputSingle."""
+        return self._build_v3_swap(tx, method_name, decoded[0], decoded[1], decoded[5], decoded[4])
+
+    def _build_v3_swap(
+        self,
+        tx: dict[str, Any],
+        method_name: str,
+        token_in_addr: str,
+        token_out_addr: str,
+        amount_in: int,
+        amount_out: int,
+    ) -> SwapInfo:
+        """Build SwapInfo for a V3 swap from decoded token addresses and raw amounts."""
+        token_in_addr = intern_address(token_in_addr)
+        token_out_addr = intern_address(token_out_addr)
+
+        decimals_in = self._get_token_decimals(token_in_addr)
+        decimals_out = self._get_token_decimals(token_out_addr)
+
+        action = "BUY" if self._is_stablecoin(token_in_addr) else "SELL"
+
+        return SwapInfo(
+            dex="pancakeswap_v3",
+            action=action,
+            token_in=self._get_token_symbol(token_in_addr),
+            token_in_address=token_in_addr,
+            token_in_amount_raw=amount_in,
+            decimals_in=decimals_in,
+            token_out=self._get_token_symbol(token_out_addr),
+            token_out_address=token_out_addr,
+            token_out_amount_raw=amount_out,
+            decimals_out=decimals_out,
+            amount_usd_micro=self._calculate_usd_value(token_in_addr, amount_in, decimals_in),
+            router_address=intern_address(tx.get("to", "")),
+            method=method_name,
+            chain=self.chain,
+        )
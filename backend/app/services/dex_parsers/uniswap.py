@@ -3,12 +3,23 @@ Uniswap V2/V3 Transaction Parser
 Parses swap transactions from Uniswap routers
 """
 
-from dataclasses import dataclass
+import binascii
+import re
 from decimal import Decimal
-from typing import Any
+from typing import Any, Callable, Iterable
 
-from web3 import Web3
-from eth_abi import decode
+from web3 import AsyncWeb3
+
+from app.services.dex_parsers._base import (
+    CALLDATA_ERRORS,
+    USD_SCALE,
+    V2_MIN_CALLDATA_LEN,
+    SwapInfo,
+    to_usd_micro,
+)
+from app.services.dex_parsers._calldata import ARGS_START, WORD_HEX, address_int, build_decoder, intern_address
+from app.services.dex_parsers._token_cache import TokenMetadataCache, get_token_cache
+from app.services.dex_parsers._tokens import STABLECOINS_BY_CHAIN
 
 # Uniswap V2 Router address (Ethereum mainnet)
 UNISWAP_V2_ROUTER = "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D"
@@ -22,6 +33,17 @@ WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
 USDT = "0xdAC17F958D2ee523a2206206994597C13D831ec7"
 USDC = "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48"
 
+# Lowercase forms of the constants above, compared against on every transaction
+_UNISWAP_V2_ROUTER_L = UNISWAP_V2_ROUTER.lower()
+_UNISWAP_V3_ROUTER_L = UNISWAP_V3_ROUTER.lower()
+_UNISWAP_V3_ROUTER_2_L = UNISWAP_V3_ROUTER_2.lower()
+_WETH_L = WETH.lower()
+_USDT_L = USDT.lower()
+_USDC_L = USDC.lower()
+_STABLE_INTS = frozenset(int(address, 16) for address in STABLECOINS_BY_CHAIN["ethereum"])
+_WETH_INT = int(WETH, 16)
+_ETH_LIKE = frozenset({"ETH", "WETH"})
+
 # Method signatures for swap functions
 SWAP_SIGNATURES = {
     # Uniswap V2
@@ -41,66 +63,57 @@ SWAP_SIGNATURES = {
     "0xb858183f": "exactInput",
 }
 
+# Pre-normalized lookup sets for the is_uniswap_transaction hot path
+_ROUTERS_LOWER = frozenset({_UNISWAP_V2_ROUTER_L, _UNISWAP_V3_ROUTER_L, _UNISWAP_V3_ROUTER_2_L})
 
-@dataclass
-class SwapInfo:
-    """Parsed swap transaction information."""
-
-    dex: str
-    action: str  # BUY or SELL
-    token_in: str
-    token_in_address: str
-    token_in_amount: Decimal
-    token_out: str
-    token_out_address: str
-    token_out_amount: Decimal
-    amount_usd: Decimal
-    router_address: str
-    method: str
+# Single compiled scanner over the selector prefix: fast reject for non-swap calldata
+_SWAP_RE = re.compile("0x(?:" + "|".join(sig[2:] for sig in SWAP_SIGNATURES) + ")", re.IGNORECASE)
 
 
 class UniswapParser:
     """Parser for Uniswap V2 and V3 transactions."""
 
-    def __init__(self, web3: Web3, token_prices: dict[str, Decimal] | None = None):
+    chain = "ethereum"
+    swap_signatures = SWAP_SIGNATURES
+
+    def __init__(
+        self,
+        web3: AsyncWeb3,
+        token_prices: dict[str, Decimal] | None = None,
+        cache: TokenMetadataCache | None = None,
+    ):
         """
         Initialize the parser.
 
         Args:
-            web3: Web3 instance for blockchain interaction
+            web3: AsyncWeb3 instance for blockchain interaction
             token_prices: Optional dict of token address -> USD price
+            cache: Token metadata cache (defaults to the shared process-wide cache)
         """
         self.web3 = web3
         self.token_prices = token_prices or {}
-
-        # Token symbol cache
-        self._token_symbols: dict[str, str] = {
-            WETH.lower(): "WETH",
-            USDT.lower(): "USDT",
-            USDC.lower(): "USDC",
-        }
+        self.prices_micro = {token.lower(): to_usd_micro(price) for token, price in self.token_prices.items()}
+        self.eth_price_micro = self.prices_micro.get(_WETH_L, to_usd_micro(Decimal("2000")))
+
+        self.cache = cache or get_token_cache()
+        self.cache.seed(
+            self.chain,
+            symbols={_WETH_L: "WETH", _USDT_L: "USDT", _USDC_L: "USDC"},
+            # Known stablecoins with non-18 decimals
+            decimals={_USDT_L: 6, _USDC_L: 6},
+        )
+
+    @property
+    def routers(self) -> frozenset[str]:
+        """Router addresses handled by this parser (lowercase)."""
+        return _ROUTERS_LOWER
 
     def is_uniswap_transaction(self, tx: dict[str, Any]) -> bool:
         """Check if a transaction is a Uniswap swap."""
-        to_address = tx.get("to", "").lower()
-        input_data = tx.get("input", "")
-
-        # Check if it's to a Uniswap router
-        routers = [
-            UNISWAP_V2_ROUTER.lower(),
-            UNISWAP_V3_ROUTER.lower(),
-            UNISWAP_V3_ROUTER_2.lower(),
-        ]
-
-        if to_address not in routers:
-            return False
-
-        # Check if method signature is a swap
-        if len(input_data) < 10:
-            return False
-
-        method_sig = input_data[:10]
-        return method_sig in SWAP_SIGNATURES
+        return (
+            tx.get("to", "").lower() in _ROUTERS_LOWER
+            and _SWAP_RE.match(tx.get("input", "")) is not None
+        )
 
     def parse_transaction(self, tx: dict[str, Any]) -> SwapInfo | None:
         """
@@ -112,218 +125,300 @@ class UniswapParser:
         Returns:
             SwapInfo if successfully parsed, None otherwise
         """
-        if not self.is_uniswap_transaction(tx):
+        decoded = self._decode(tx)
+        if decoded is None:
             return None
+        return self._build(tx, decoded)
 
-        input_data = tx.get("input", "")
-        method_sig = input_data[:10]
-        method_name = SWAP_SIGNATURES.get(method_sig, "unknown")
+    async def parse_block(self, txs: Iterable[dict[str, Any]]) -> list[tuple[dict[str, Any], SwapInfo]]:
+        """
+        Parse all Uniswap swaps in a block's transactions.
 
-        to_address = tx.get("to", "").lower()
+        Decodes every candidate first so the metadata for all tokens in the
+        block is fetched in one awaited prefetch, then builds the SwapInfo
+        objects from the warm cache. Building is pure CPU once the cache is
+        warm, so it runs inline: a thread pool would only add GIL contention.
 
-        # Determine DEX version
-        if to_address == UNISWAP_V2_ROUTER.lower():
-            return self._parse_v2_swap(tx, method_name)
-        else:
-            return self._parse_v3_swap(tx, method_name)
+        Args:
+            txs: Full transaction dicts from web3 (e.g. get_block(..., True))
+
+        Returns:
+            (transaction, SwapInfo) pairs in transaction order
+        """
+        candidates = [(tx, decoded) for tx in txs if (decoded := self._decode(tx)) is not None]
+        if not candidates:
+            return []
+
+        await self.prefetch_token_metadata(
+            address for _, decoded in candidates for address in _swap_tokens(decoded)
+        )
+
+        return [(tx, swap) for tx, decoded in candidates if (swap := self._build(tx, decoded)) is not None]
+
+    def _decode(self, tx: dict[str, Any]) -> tuple[tuple, tuple] | None:
+        """Decode a Uniswap swap's arguments, returning (handler, decoded args)."""
+        if not self.is_uniswap_transaction(tx):
+            return None
+
+        # V2 and V3 routers speak different ABIs
+        handlers = _ROUTER_HANDLERS.get(tx.get("to", "").lower())
+        if handlers is None:
+            return None
 
-    def _parse_v2_swap(self, tx: dict[str, Any], method_name: str) -> SwapInfo | None:
-        """Parse Uniswap V2 swap transaction."""
         input_data = tx.get("input", "")
-        value = tx.get("value", 0)
+        try:
+            handler = handlers.get(bytes.fromhex(input_data[2:10]))
+        except ValueError:
+            return None
 
+        if handler is None:
+            return None
+
+        # Reject truncated calldata before decoding anything
+        if len(input_data) < handler[4]:
+            return None
+
+        # Hex-decode the payload once for the ABI decoder
         try:
-            if method_name == "swapExactETHForTokens":
-                # (uint amountOutMin, address[] path, address to, uint deadline)
-                decoded = decode(
-                    ["uint256", "address[]", "address", "uint256"],
-                    bytes.fromhex(input_data[10:]),
-                )
-                amount_out_min = Decimal(str(decoded[0])) / Decimal("1e18")
-                path = decoded[1]
-
-                return SwapInfo(
-                    dex="uniswap_v2",
-                    action="BUY",
-                    token_in="ETH",
-                    token_in_address=WETH,
-                    token_in_amount=Decimal(str(value)) / Decimal("1e18"),
-                    token_out=self._get_token_symbol(path[-1]),
-                    token_out_address=path[-1],
-                    token_out_amount=amount_out_min,
-                    amount_usd=self._calculate_usd_value("ETH", Decimal(str(value)) / Decimal("1e18")),
-                    router_address=UNISWAP_V2_ROUTER,
-                    method=method_name,
-                )
-
-            elif method_name == "swapExactTokensForETH":
-                # (uint amountIn, uint amountOutMin, address[] path, address to, uint deadline)
-                decoded = decode(
-                    ["uint256", "uint256", "address[]", "address", "uint256"],
-                    bytes.fromhex(input_data[10:]),
-                )
-                amount_in = decoded[0]
-                path = decoded[2]
-
-                token_in_addr = path[0]
-                decimals = self._get_token_decimals(token_in_addr)
-                amount_in_decimal = Decimal(str(amount_in)) / Decimal(f"1e{decimals}")
-
-                return SwapInfo(
-                    dex="uniswap_v2",
-                    action="SELL",
-                    token_in=self._get_token_symbol(token_in_addr),
-                    token_in_address=token_in_addr,
-                    token_in_amount=amount_in_decimal,
-                    token_out="ETH",
-                    token_out_address=WETH,
-                    token_out_amount=Decimal(str(decoded[1])) / Decimal("1e18"),
-                    amount_usd=self._calculate_usd_value(token_in_addr, amount_in_decimal),
-                    router_address=UNISWAP_V2_ROUTER,
-                    method=method_name,
-                )
-
-            elif method_name == "swapExactTokensForTokens":
-                # (uint amountIn, uint amountOutMin, address[] path, address to, uint deadline)
-                decoded = decode(
-                    ["uint256", "uint256", "address[]", "address", "uint256"],
-                    bytes.fromhex(input_data[10:]),
-                )
-                amount_in = decoded[0]
-                path = decoded[2]
-
-                token_in_addr = path[0]
-                token_out_addr = path[-1]
-
-                decimals_in = self._get_token_decimals(token_in_addr)
-                decimals_out = self._get_token_decimals(token_out_addr)
-
-                amount_in_decimal = Decimal(str(amount_in)) / Decimal(f"1e{decimals_in}")
-
-                # Determine action based on token types
-                action = "BUY" if self._is_stablecoin(token_in_addr) else "SELL"
-
-                return SwapInfo(
-                    dex="uniswap_v2",
-                    action=action,
-                    token_in=self._get_token_symbol(token_in_addr),
-                    token_in_address=token_in_addr,
-                    token_in_amount=amount_in_decimal,
-                    token_out=self._get_token_symbol(token_out_addr),
-                    token_out_address=token_out_addr,
-                    token_out_amount=Decimal(str(decoded[1])) / Decimal(f"1e{decimals_out}"),
-                    amount_usd=self._calculate_usd_value(token_in_addr, amount_in_decimal),
-                    router_address=UNISWAP_V2_ROUTER,
-                    method=method_name,
-                )
-
-        except Exception:
-            pass
-
-        return None
-
-    def _parse_v3_swap(self, tx: dict[str, Any], method_name: str) -> SwapInfo | None:
-        """Parse Uniswap V3 swap transaction."""
-        input_data = tx.get("input", "")
-        value = tx.get("value", 0)
-        to_address = tx.get("to", "")
+            return handler, handler[1](binascii.unhexlify(input_data[ARGS_START:]))
+        except CALLDATA_ERRORS:
+            return None
 
+    def _build(self, tx: dict[str, Any], decoded: tuple[tuple, tuple]) -> SwapInfo | None:
+        """Build SwapInfo from a decoded swap."""
+        (method_name, _, parse, _, _), args = decoded
         try:
-            if method_name == "exactInputSingle":
-                # struct ExactInputSingleParams {
-                #     address tokenIn;
-                #     address tokenOut;
-                #     uint24 fee;
-                #     address recipient;
-                #     uint256 deadline;
-                #     uint256 amountIn;
-                #     uint256 amountOutMinimum;
-                #     uint160 sqrtPriceLimitX96;
-                # }
-                decoded = decode(
-                    ["address", "address", "uint24", "address", "uint256", "uint256", "uint256", "uint160"],
-                    bytes.fromhex(input_data[10:]),
-                )
-
-                token_in_addr = decoded[0]
-                token_out_addr = decoded[1]
-                amount_in = decoded[5]
-
-                decimals_in = self._get_token_decimals(token_in_addr)
-                decimals_out = self._get_token_decimals(token_out_addr)
-
-                amount_in_decimal = Decimal(str(amount_in)) / Decimal(f"1e{decimals_in}")
-
-                action = "BUY" if self._is_stablecoin(token_in_addr) else "SELL"
-
-                return SwapInfo(
-                    dex="uniswap_v3",
-                    action=action,
-                    token_in=self._get_token_symbol(token_in_addr),
-                    token_in_address=token_in_addr,
-                    token_in_amount=amount_in_decimal,
-                    token_out=self._get_token_symbol(token_out_addr),
-                    token_out_address=token_out_addr,
-                    token_out_amount=Decimal(str(decoded[6])) / Decimal(f"1e{decimals_out}"),
-                    amount_usd=self._calculate_usd_value(token_in_addr, amount_in_decimal),
-                    router_address=to_address,
-                    method=method_name,
-                )
-
-        except Exception:
-            pass
-
-        return None
+            return parse(self, tx, method_name, args)
+        except CALLDATA_ERRORS:
+            return None
+
+    def _parse_v2_eth_for_tokens(self, tx: dict[str, Any], method_name: str, decoded: tuple) -> SwapInfo:
+        """Parse V2 swapExactETHForTokens."""
+        amount_out_min = decoded[0]
+        token_out_addr = intern_address(decoded[1][-1])
+        amount_in = tx.get("value", 0)
+
+        return SwapInfo(
+            dex="uniswap_v2",
+            action="BUY",
+            token_in="ETH",
+            token_in_address=_WETH_L,
+            token_in_amount_raw=amount_in,
+            decimals_in=18,
+            token_out=self._get_token_symbol(token_out_addr),
+            token_out_address=token_out_addr,
+            token_out_amount_raw=amount_out_min,
+            decimals_out=18,
+            amount_usd_micro=self._calculate_usd_value("ETH", amount_in, 18),
+            router_address=_UNISWAP_V2_ROUTER_L,
+            method=method_name,
+            chain=self.chain,
+        )
+
+    def _parse_v2_tokens_for_eth(self, tx: dict[str, Any], method_name: str, decoded: tuple) -> SwapInfo:
+        """Parse V2 swapExactTokensForETH."""
+        amount_in = decoded[0]
+        token_in_addr = intern_address(decoded[2][0])
+
+        decimals = self._get_token_decimals(token_in_addr)
+
+        return SwapInfo(
+            dex="uniswap_v2",
+            action="SELL",
+            token_in=self._get_token_symbol(token_in_addr),
+            token_in_address=token_in_addr,
+            token_in_amount_raw=amount_in,
+            decimals_in=decimals,
+            token_out="ETH",
+            token_out_address=_WETH_L,
+            token_out_amount_raw=decoded[1],
+            decimals_out=18,
+            amount_usd_micro=self._calculate_usd_value(token_in_addr, amount_in, decimals),
+            router_address=_UNISWAP_V2_ROUTER_L,
+            method=method_name,
+            chain=self.chain,
+        )
+
+    def _parse_v2_tokens_for_tokens(self, tx: dict[str, Any], method_name: str, decoded: tuple) -> SwapInfo:
+        """Parse V2 swapExactTokensForTokens."""
+        amount_in = decoded[0]
+        path = decoded[2]
+
+        token_in_addr = intern_address(path[0])
+        token_out_addr = intern_address(path[-1])
+
+        decimals_in = self._get_token_decimals(token_in_addr)
+        decimals_out = self._get_token_decimals(token_out_addr)
+
+        # Determine action based on token types
+        action = "BUY" if self._is_stablecoin(token_in_addr) else "SELL"
+
+        return SwapInfo(
+            dex="uniswap_v2",
+            action=action,
+            token_in=self._get_token_symbol(token_in_addr),
+            token_in_address=token_in_addr,
+            token_in_amount_raw=amount_in,
+            decimals_in=decimals_in,
+            token_out=self._get_token_symbol(token_out_addr),
+            token_out_address=token_out_addr,
+            token_out_amount_raw=decoded[1],
+            decimals_out=decimals_out,
+            amount_usd_micro=self._calculate_usd_value(token_in_addr, amount_in, decimals_in),
+            router_address=_UNISWAP_V2_ROUTER_L,
+            method=method_name,
+            chain=self.chain,
+        )
+
+    def _parse_v3_exact_input_single(self, tx: dict[str, Any], method_name: str, decoded: tuple) -> SwapInfo:
+        """Parse V3 exactInputSingle (SwapRouter layout, with deadline)."""
+        return self._build_v3_swap(tx, method_name, decoded[0], decoded[1], decoded[5], decoded[6])
+
+    def _parse_v3_exact_input_single_02(self, tx: dict[str, Any], method_name: str, decoded: tuple) -> SwapInfo:
+        """Parse V3 exactInputSingle (SwapRouter02 layout, no deadline)."""
+        return self._build_v3_swap(tx, method_name, decoded[0], decoded[1], decoded[4], decoded[5])
+
+    def _build_v3_swap(
+        self,
+        tx: dict[str, Any],
+        method_name: str,
+        token_in_addr: str,
+        token_out_addr: str,
+        amount_in: int,
+        amount_out: int,
+    ) -> SwapInfo:
+        """Build SwapInfo for a V3 swap from decoded token addresses and raw amounts."""
+        token_in_addr = intern_address(token_in_addr)
+        token_out_addr = intern_address(token_out_addr)
+
+        decimals_in = self._get_token_decimals(token_in_addr)
+        decimals_out = self._get_token_decimals(token_out_addr)
+
+        action = "BUY" if self._is_stablecoin(token_in_addr) else "SELL"
+
+        return SwapInfo(
+            dex="uniswap_v3",
+            action=action,
+            token_in=self._get_token_symbol(token_in_addr),
+            token_in_address=token_in_addr,
+            token_in_amount_raw=amount_in,
+            decimals_in=decimals_in,
+            token_out=self._get_token_symbol(token_out_addr),
+            token_out_address=token_out_addr,
+            token_out_amount_raw=amount_out,
+            decimals_out=decimals_out,
+            amount_usd_micro=self._calculate_usd_value(token_in_addr, amount_in, decimals_in),
+            router_address=intern_address(tx.get("to", "")),
+            method=method_name,
+            chain=self.chain,
+        )
+
+    async def prefetch_token_metadata(self, addresses: Iterable[str]) -> None:
+        """Load symbol/decimals for uncached tokens ahead of parsing."""
+        await self.cache.prefetch(self.web3, self.chain, addresses)
 
     def _get_token_symbol(self, address: str) -> str:
         """Get token symbol from address."""
-        address = address.lower()
-        if address in self._token_symbols:
-            return self._token_symbols[address]
-
-        # Try to fetch from contract
-        try:
-            contract = self.web3.eth.contract(
-                address=Web3.to_checksum_address(address),
-                abi=[{"constant": True, "inputs": [], "name": "symbol", "outputs": [{"name": "", "type": "string"}], "type": "function"}],
-            )
-            symbol = contract.functions.symbol().call()
-            self._token_symbols[address] = symbol
-            return symbol
-        except Exception:
-            return address[:8] + "..."
+        return self.cache.get_symbol(self.chain, address)
 
     def _get_token_decimals(self, address: str) -> int:
         """Get token decimals from address."""
-        address = address.lower()
+        return self.cache.get_decimals(self.chain, address)
 
-        # Known stablecoins
-        if address in [USDT.lower(), USDC.lower()]:
-            return 6
+    def _is_stablecoin(self, address: str) -> bool:
+        """Check if address is a stablecoin."""
+        try:
+            return address_int(address) in _STABLE_INTS
+        except ValueError:
+            return False
 
-        # Most ERC20 tokens use 18 decimals
+    def _is_weth(self, address: str) -> bool:
+        """Check if address is WETH."""
         try:
-            contract = self.web3.eth.contract(
-                address=Web3.to_checksum_address(address),
-                abi=[{"constant": True, "inputs": [], "name": "decimals", "outputs": [{"name": "", "type": "uint8"}], "type": "function"}],
-            )
-            return contract.functions.decimals().call()
-        except Exception:
-            return 18
+            return address_int(address) == _WETH_INT
+        except ValueError:
+            return False
 
-    def _is_stablecoin(self, address: str) -> bool:
-        """Check if address is a stablecoin."""
-        address = address.lower()
-        stablecoins = [USDT.lower(), USDC.lower()]
-        return address in stablecoins
-
-    def _calculate_usd_value(self, token: str, amount: Decimal) -> Decimal:
-        """Calculate USD value of a token amount."""
-        if token.upper() in ["ETH", "WETH"]:
-            eth_price = self.token_prices.get(WETH.lower(), Decimal("2000"))
-            return amount * eth_price
+    def _calculate_usd_value(self, token: str, amount_raw: int, decimals: int) -> int:
+        """Calculate USD value (micro-dollars) of a raw token amount."""
+        if token in _ETH_LIKE or self._is_weth(token):
+            price_micro = self.eth_price_micro
         elif self._is_stablecoin(token):
-            return amount
+            price_micro = USD_SCALE
         else:
-            price = self.token_prices.get(token.lower(), Decimal("0"))
-            return amount * price
+            price_micro = self.prices_micro.get(token.lower(), 0)
+        return amount_raw * price_micro // 10 ** decimals
+
+
+# Prebuilt ABI decoders per swap family
+_decode_v2_eth_for_tokens = build_decoder("uint256", "address[]", "address", "uint256")
+_decode_v2_tokens_for_x = build_decoder("uint256", "uint256", "address[]", "address", "uint256")
+# struct ExactInputSingleParams {
+#     address tokenIn;
+#     address tokenOut;
+#     uint24 fee;
+#     address recipient;
+#     uint256 deadline;         (SwapRouter only)
+#     uint256 amountIn;
+#     uint256 amountOutMinimum;
+#     uint160 sqrtPriceLimitX96;
+# }
+_decode_v3_exact_input_single = build_decoder(
+    "address", "address", "uint24", "address", "uint256", "uint256", "uint256", "uint160"
+)
+_decode_v3_exact_input_single_02 = build_decoder(
+    "address", "address", "uint24", "address", "uint256", "uint256", "uint160"
+)
+
+
+# Decoded args -> token addresses the swap touches (for block-level prefetch)
+def _eth_for_tokens_tokens(args: tuple) -> tuple[str, ...]:
+    return (args[1][-1],)
+
+
+def _tokens_for_x_tokens(args: tuple) -> tuple[str, ...]:
+    return (args[2][0], args[2][-1])
+
+
+def _v3_single_tokens(args: tuple) -> tuple[str, ...]:
+    return (args[0], args[1])
+
+
+def _swap_tokens(decoded: tuple[tuple, tuple]) -> tuple[str, ...]:
+    """Interned token addresses of a decoded swap (empty for a malformed path)."""
+    handler, args = decoded
+    try:
+        return tuple(intern_address(address) for address in handler[3](args))
+    except IndexError:
+        return ()
+
+
+# Selector -> (method name, ABI decoder, parse function, token extractor, minimum calldata length)
+_Handler = tuple[str, Callable[[bytes], tuple], Callable[..., SwapInfo], Callable[[tuple], tuple[str, ...]], int]
+
+_V2_HANDLERS: dict[bytes, _Handler] = {
+    bytes.fromhex(sig[2:]): (SWAP_SIGNATURES[sig], decode_args, parse, tokens, V2_MIN_CALLDATA_LEN[sig])
+    for sig, decode_args, parse, tokens in (
+        ("0x7ff36ab5", _decode_v2_eth_for_tokens, UniswapParser._parse_v2_eth_for_tokens, _eth_for_tokens_tokens),
+        ("0x18cbafe5", _decode_v2_tokens_for_x, UniswapParser._parse_v2_tokens_for_eth, _tokens_for_x_tokens),
+        ("0x38ed1739", _decode_v2_tokens_for_x, UniswapParser._parse_v2_tokens_for_tokens, _tokens_for_x_tokens),
+    )
+}
+_V3_HANDLERS: dict[bytes, _Handler] = {
+    bytes.fromhex(sig[2:]): (SWAP_SIGNATURES[sig], decode_args, parse, tokens, min_len)
+    for sig, decode_args, parse, tokens, min_len in (
+        # 8 static struct words (SwapRouter, with deadline)
+        ("0x414bf389", _decode_v3_exact_input_single, UniswapParser._parse_v3_exact_input_single, _v3_single_tokens,
+         ARGS_START + WORD_HEX * 8),
+        # 7 static struct words (SwapRouter02, no deadline)
+        ("0x04e45aaf", _decode_v3_exact_input_single_02, UniswapParser._parse_v3_exact_input_single_02, _v3_single_tokens,
+         ARGS_START + WORD_HEX * 7),
+    )
+}
+
+# Router address -> handler table for its ABI
+_ROUTER_HANDLERS = {
+    _UNISWAP_V2_ROUTER_L: _V2_HANDLERS,
+    _UNISWAP_V3_ROUTER_L: _V3_HANDLERS,
+    _UNISWAP_V3_ROUTER_2_L: _V3_HANDLERS,
+}
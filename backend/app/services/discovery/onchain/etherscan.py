@@ -10,15 +10,19 @@ Features:
 """
 
 import asyncio
+import itertools
 import logging
 import os
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from operator import itemgetter
+from typing import AsyncIterator, Optional
 
 import httpx
-from sqlalchemy import select
+import orjson
+from sqlalchemy import case, func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.onchain_wallet import (
@@ -30,6 +34,9 @@ from app.models.onchain_wallet import (
 
 logger = logging.getLogger(__name__)
 
+# Explorer APIs cap page * offset at 10,000 results per query
+MAX_RESULT_WINDOW = 10000
+
 # API configuration
 ETHERSCAN_API_KEY = os.getenv("ETHERSCAN_API_KEY", "")
 BSCSCAN_API_KEY = os.getenv("BSCSCAN_API_KEY", "")
@@ -63,8 +70,11 @@ CHAIN_APIS = {
     },
 }
 
+# Concurrent explorer requests per discovery run (free tier allows 5 req/s)
+MAX_CONCURRENT_REQUESTS = 3
+
 # Known whale addresses (curated list)
-KNOWN_WHALES = {
+_RAW_KNOWN_WHALES = {
     "ETHEREUM": [
         # Major funds/institutions
         ("0x28C6c06298d514Db089934071355E5743bf21d60", "Binance Hot Wallet", WalletType.EXCHANGE),
@@ -82,8 +92,11 @@ KNOWN_WHALES = {
     ],
 }
 
+# tokentx row -> (from, to)
+_TRANSFER_PARTIES = itemgetter("from", "to")
+
 # Popular tokens to track holders
-TRACKED_TOKENS = {
+_RAW_TRACKED_TOKENS = {
     "ETHEREUM": [
         ("0xdAC17F958D2ee523a2206206994597C13D831ec7", "USDT", 6),
         ("0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48", "USDC", 6),
@@ -99,7 +112,7 @@ TRACKED_TOKENS = {
 }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WalletInfo:
     """Information about a discovered wallet."""
     address: str
@@ -111,6 +124,28 @@ class WalletInfo:
     discovery_source: str
 
 
+# Pre-normalized static data: lowercase addresses, immutable WalletInfo built once
+KNOWN_WHALES: dict[str, tuple[WalletInfo, ...]] = {
+    chain: tuple(
+        WalletInfo(
+            address=address.lower(),
+            chain=chain,
+            label=label,
+            wallet_type=wallet_type,
+            balance_usd=None,
+            tx_count=0,
+            discovery_source=DiscoverySource.KNOWN_WHALE,
+        )
+        for address, label, wallet_type in whales
+    )
+    for chain, whales in _RAW_KNOWN_WHALES.items()
+}
+TRACKED_TOKENS: dict[str, tuple[tuple[str, str, int], ...]] = {
+    chain: tuple((address.lower(), symbol, decimals) for address, symbol, decimals in tokens)
+    for chain, tokens in _RAW_TRACKED_TOKENS.items()
+}
+
+
 class EtherscanDiscovery:
     """
     Discovers whale wallets using Etherscan-family APIs.
@@ -123,11 +158,25 @@ class EtherscanDiscovery:
     """
 
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=8),
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        # Endpoint URLs parsed once instead of on every request
+        self._endpoints = {
+            chain: httpx.URL(config["base_url"]) for chain, config in CHAIN_APIS.items()
+        }
 
     async def close(self):
         await self.client.aclose()
 
+    async def _get(self, chain: str, params: dict) -> httpx.Response:
+        """Send a GET to a chain's explorer API using its pre-parsed endpoint."""
+        request = self.client.build_request("GET", self._endpoints[chain], params=params)
+        return await self.client.send(request)
+
     async def discover_whales(
         self,
         chain: str = "ETHEREUM",
@@ -151,12 +200,12 @@ class EtherscanDiscovery:
         token_holders = await self._get_top_token_holders(chain, limit=50)
         wallets.extend(token_holders)
 
-        # Deduplicate by address
+        # Deduplicate by address (all sources yield lowercase addresses)
         seen = set()
         unique_wallets = []
         for w in wallets:
-            if w.address.lower() not in seen:
-                seen.add(w.address.lower())
+            if w.address not in seen:
+                seen.add(w.address)
                 unique_wallets.append(w)
 
         logger.info(f"Discovered {len(unique_wallets)} unique wallets on {chain}")
@@ -164,21 +213,7 @@ class EtherscanDiscovery:
 
     async def _get_known_whales(self, chain: str) -> list[WalletInfo]:
         """Get pre-defined known whale addresses."""
-        wallets = []
-
-        known_list = KNOWN_WHALES.get(chain, [])
-        for address, label, wallet_type in known_list:
-            wallets.append(WalletInfo(
-                address=address,
-                chain=chain,
-                label=label,
-                wallet_type=wallet_type,
-                balance_usd=None,
-                tx_count=0,
-                discovery_source=DiscoverySource.KNOWN_WHALE,
-            ))
-
-        return wallets
+        return list(KNOWN_WHALES.get(chain, ()))
 
     async def _get_top_token_holders(
         self,
@@ -198,21 +233,26 @@ class EtherscanDiscovery:
             logger.warning(f"No API key for {chain}, skipping token holders")
             return wallets
 
-        tokens = TRACKED_TOKENS.get(chain, [])
+        tokens = TRACKED_TOKENS.get(chain, ())[:3]  # Limit to 3 tokens
 
-        for token_address, token_symbol, decimals in tokens[:3]:  # Limit to 3 tokens
-            try:
+        # Rate limit protection: cap in-flight requests instead of sleeping between them
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def fetch_with_semaphore(token_address: str, token_symbol: str):
+            async with semaphore:
                 # Etherscan tokentx endpoint to find active holders
-                holders = await self._fetch_token_holders(
+                return await self._fetch_token_holders(
                     chain, token_address, token_symbol, limit=20
                 )
-                wallets.extend(holders)
 
-                # Rate limit protection
-                await asyncio.sleep(0.25)
+        tasks = [fetch_with_semaphore(address, symbol) for address, symbol, _ in tokens]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            except Exception as e:
-                logger.error(f"Error fetching {token_symbol} holders on {chain}: {e}")
+        for (_, token_symbol, _), result in zip(tokens, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching {token_symbol} holders on {chain}: {result}")
+            else:
+                wallets.extend(result)
 
         return wallets
 
@@ -233,7 +273,6 @@ class EtherscanDiscovery:
         try:
             # Get recent token transfers to find active holders
             # Note: For true top holders, Etherscan Pro API is needed
-            url = api_config["base_url"]
             params = {
                 "module": "account",
                 "action": "tokentx",
@@ -244,49 +283,41 @@ class EtherscanDiscovery:
                 "apikey": api_config["api_key"],
             }
 
-            response = await self.client.get(url, params=params)
+            response = await self._get(chain, params)
 
             if response.status_code != 200:
                 logger.warning(f"Etherscan API returned {response.status_code}")
                 return wallets
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if data.get("status") != "1":
                 logger.warning(f"Etherscan API error: {data.get('message')}")
                 return wallets
 
-            # Extract unique addresses from transfers
-            seen_addresses = set()
+            # Extract unique addresses from transfers (first-seen order);
+            # map/chain/dict.fromkeys keep the per-tx work in C
             result = data.get("result", [])
-
-            for tx in result:
-                for addr_key in ["from", "to"]:
-                    addr = tx.get(addr_key, "").lower()
-
-                    # Skip contracts and known DEX routers
-                    if not addr or addr in seen_addresses:
-                        continue
-                    if addr == token_address.lower():
-                        continue
-
-                    seen_addresses.add(addr)
-
-                    wallets.append(WalletInfo(
-                        address=addr,
-                        chain=chain,
-                        label=None,
-                        wallet_type=WalletType.UNKNOWN,
-                        balance_usd=None,
-                        tx_count=0,
-                        discovery_source=DiscoverySource.TOKEN_TRANSFER,
-                    ))
-
-                    if len(wallets) >= limit:
-                        break
-
-                if len(wallets) >= limit:
-                    break
+            addresses = dict.fromkeys(
+                map(str.lower, itertools.chain.from_iterable(map(_TRANSFER_PARTIES, result)))
+            )
+
+            # Skip empty fields and the token contract itself
+            addresses.pop("", None)
+            addresses.pop(token_address.lower(), None)
+
+            wallets = [
+                WalletInfo(
+                    address=addr,
+                    chain=chain,
+                    label=None,
+                    wallet_type=WalletType.UNKNOWN,
+                    balance_usd=None,
+                    tx_count=0,
+                    discovery_source=DiscoverySource.TOKEN_TRANSFER,
+                )
+                for addr in itertools.islice(addresses, limit)
+            ]
 
         except Exception as e:
             logger.error(f"Error fetching token holders: {e}")
@@ -306,26 +337,82 @@ class EtherscanDiscovery:
         if not api_config or not api_config["api_key"]:
             return []
 
+        return await self._fetch_txlist_page(
+            chain, api_config["api_key"], address, from_block, page=1, offset=limit
+        )
+
+    async def iter_wallet_transactions(
+        self,
+        address: str,
+        chain: str = "ETHEREUM",
+        from_block: int = 0,
+        page_size: int = 100,
+    ) -> AsyncIterator[dict]:
+        """
+        Stream a wallet's transactions page by page (newest first).
+
+        The next page is requested before the current one is yielded, so
+        callers filtering rows overlap their work with the HTTP round trip
+        and never hold more than two pages in memory.
+        """
+        api_config = CHAIN_APIS.get(chain)
+
+        if not api_config or not api_config["api_key"]:
+            return
+
+        api_key = api_config["api_key"]
+        max_pages = MAX_RESULT_WINDOW // page_size
+
+        def fetch(page: int) -> asyncio.Task:
+            return asyncio.create_task(
+                self._fetch_txlist_page(chain, api_key, address, from_block, page, page_size)
+            )
+
+        page = 1
+        pending = fetch(page)
+        try:
+            while pending is not None:
+                rows = await pending
+                pending = None
+                if len(rows) == page_size and page < max_pages:
+                    page += 1
+                    pending = fetch(page)
+
+                for tx in rows:
+                    yield tx
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    async def _fetch_txlist_page(
+        self,
+        chain: str,
+        api_key: str,
+        address: str,
+        from_block: int,
+        page: int,
+        offset: int,
+    ) -> list[dict]:
+        """Fetch one page of a wallet's normal transactions."""
         try:
-            url = api_config["base_url"]
             params = {
                 "module": "account",
                 "action": "txlist",
                 "address": address,
                 "startblock": from_block,
                 "endblock": 99999999,
-                "page": 1,
-                "offset": limit,
+                "page": page,
+                "offset": offset,
                 "sort": "desc",
-                "apikey": api_config["api_key"],
+                "apikey": api_key,
             }
 
-            response = await self.client.get(url, params=params)
+            response = await self._get(chain, params)
 
             if response.status_code != 200:
                 return []
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if data.get("status") != "1":
                 return []
@@ -350,7 +437,6 @@ class EtherscanDiscovery:
             return []
 
         try:
-            url = api_config["base_url"]
             params = {
                 "module": "account",
                 "action": "txlistinternal",
@@ -363,12 +449,12 @@ class EtherscanDiscovery:
                 "apikey": api_config["api_key"],
             }
 
-            response = await self.client.get(url, params=params)
+            response = await self._get(chain, params)
 
             if response.status_code != 200:
                 return []
 
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if data.get("status") != "1":
                 return []
@@ -384,45 +470,47 @@ class EtherscanDiscovery:
         wallets: list[WalletInfo],
         db: AsyncSession,
     ) -> int:
-        """Sync discovered wallets to database."""
-        synced = 0
-
+        """Sync discovered wallets to database with a single bulk upsert."""
+        # One row per (address, chain): Postgres rejects an upsert touching a row twice
+        rows: dict[tuple[str, str], dict] = {}
         for wallet in wallets:
-            try:
-                # Check if wallet exists
-                result = await db.execute(
-                    select(OnChainWallet).where(
-                        OnChainWallet.address == wallet.address.lower(),
-                        OnChainWallet.chain == wallet.chain,
-                    )
-                )
-                existing = result.scalar_one_or_none()
-
-                if existing:
-                    # Update existing
-                    if wallet.label and not existing.label:
-                        existing.label = wallet.label
-                    if wallet.wallet_type != WalletType.UNKNOWN:
-                        existing.wallet_type = wallet.wallet_type
-                else:
-                    # Create new
-                    new_wallet = OnChainWallet(
-                        address=wallet.address.lower(),
-                        chain=wallet.chain,
-                        label=wallet.label,
-                        wallet_type=wallet.wallet_type,
-                        discovery_source=wallet.discovery_source,
-                        is_active=True,
-                        priority_score=50,
-                    )
-                    db.add(new_wallet)
-
-                synced += 1
-
-            except Exception as e:
-                logger.error(f"Error syncing wallet {wallet.address}: {e}")
-
-        await db.commit()
+            address = wallet.address.lower()
+            rows.setdefault((address, wallet.chain), {
+                "address": address,
+                "chain": wallet.chain,
+                "label": wallet.label,
+                "wallet_type": wallet.wallet_type,
+                "discovery_source": wallet.discovery_source,
+                "is_active": True,
+                "priority_score": 50,
+            })
+
+        if not rows:
+            return 0
+
+        stmt = insert(OnChainWallet).values(list(rows.values()))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["address", "chain"],
+            set_={
+                # Keep an existing label; only fill it in when missing
+                "label": func.coalesce(OnChainWallet.label, stmt.excluded.label),
+                # Only overwrite the type with a known one
+                "wallet_type": case(
+                    (stmt.excluded.wallet_type != WalletType.UNKNOWN, stmt.excluded.wallet_type),
+                    else_=OnChainWallet.wallet_type,
+                ),
+            },
+        )
+
+        try:
+            await db.execute(stmt)
+            await db.commit()
+        except Exception as e:
+            logger.error(f"Error syncing on-chain wallets: {e}")
+            await db.rollback()
+            return 0
+
+        synced = len(rows)
         logger.info(f"Synced {synced} on-chain wallets to database")
 
         return synced
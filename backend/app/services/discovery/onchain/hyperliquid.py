@@ -19,17 +19,43 @@ API Endpoints:
 
 import asyncio
 import logging
+import random
+import weakref
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from itertools import islice
+from operator import itemgetter
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Try to import rusty-req (optional dependency): Rust-side batched HTTP fanout
+try:
+    import rusty_req
+    RUSTY_REQ_AVAILABLE = True
+except ImportError:
+    RUSTY_REQ_AVAILABLE = False
+    logger.info("rusty-req not available - Hyperliquid account fanout uses httpx")
 
-@dataclass
+# Try to import ijson (optional dependency): incremental leaderboard parsing
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    logger.info("ijson not available - Hyperliquid leaderboard is parsed in one pass")
+
+
+# Stats of one leaderboard window: (pnl, roi, volume)
+_PERF_FIELDS = itemgetter("pnl", "roi", "vlm")
+
+
+@dataclass(slots=True)
 class HyperliquidPosition:
     """Represents a position on Hyperliquid."""
     coin: str  # Symbol like "BTC", "ETH", "SOL"
@@ -54,7 +80,7 @@ class HyperliquidPosition:
         return abs(self.size)
 
 
-@dataclass
+@dataclass(slots=True)
 class HyperliquidAccount:
     """Represents a Hyperliquid account state."""
     address: str
@@ -69,28 +95,28 @@ class HyperliquidAccount:
         return len(self.positions) > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class HyperliquidTrader:
     """Represents a top trader discovered from leaderboard."""
     address: str
     display_name: Optional[str] = None
-    account_value: Decimal = Decimal("0")
+    account_value: float = 0.0
     # Daily performance
-    pnl_1d: Decimal = Decimal("0")
-    roi_1d: Decimal = Decimal("0")
-    volume_1d: Decimal = Decimal("0")
+    pnl_1d: float = 0.0
+    roi_1d: float = 0.0
+    volume_1d: float = 0.0
     # Weekly performance
-    pnl_7d: Decimal = Decimal("0")
-    roi_7d: Decimal = Decimal("0")
-    volume_7d: Decimal = Decimal("0")
+    pnl_7d: float = 0.0
+    roi_7d: float = 0.0
+    volume_7d: float = 0.0
     # Monthly performance (30d)
-    pnl_30d: Decimal = Decimal("0")
-    roi_30d: Decimal = Decimal("0")
-    volume_30d: Decimal = Decimal("0")
+    pnl_30d: float = 0.0
+    roi_30d: float = 0.0
+    volume_30d: float = 0.0
     # All time performance
-    pnl_all_time: Decimal = Decimal("0")
-    roi_all_time: Decimal = Decimal("0")
-    volume_all_time: Decimal = Decimal("0")
+    pnl_all_time: float = 0.0
+    roi_all_time: float = 0.0
+    volume_all_time: float = 0.0
 
     @property
     def is_profitable_30d(self) -> bool:
@@ -99,7 +125,164 @@ class HyperliquidTrader:
     @property
     def roi_30d_percent(self) -> float:
         """ROI as percentage (e.g., 0.15 -> 15%)"""
-        return float(self.roi_30d) * 100
+        return self.roi_30d * 100.0
+
+
+def _parse_account_state(address: str, data: dict) -> HyperliquidAccount:
+    """Build a HyperliquidAccount from a clearinghouseState response."""
+    # Parse margin summary
+    margin = data.get("marginSummary", {})
+    account_value = Decimal(margin.get("accountValue") or "0")
+    total_margin = Decimal(margin.get("totalMarginUsed") or "0")
+    withdrawable = Decimal(data.get("withdrawable") or "0")
+
+    # Parse positions
+    positions = []
+    for pos_data in data.get("assetPositions", []):
+        pos = pos_data.get("position", {})
+        if not pos:
+            continue
+
+        # Size is signed: positive = long, negative = short
+        size = Decimal(pos.get("szi") or "0")
+        if size == 0:
+            continue  # Skip zero positions
+
+        leverage_info = pos.get("leverage", {})
+        liquidation_px = pos.get("liquidationPx")
+        position_value = pos.get("positionValue")
+
+        position = HyperliquidPosition(
+            coin=pos.get("coin", ""),
+            size=size,
+            entry_price=Decimal(pos.get("entryPx") or "0"),
+            leverage=int(leverage_info.get("value", 1)),
+            leverage_type=leverage_info.get("type", "cross"),
+            unrealized_pnl=Decimal(pos.get("unrealizedPnl") or "0"),
+            margin_used=Decimal(pos.get("marginUsed") or "0"),
+            liquidation_price=Decimal(liquidation_px) if liquidation_px else None,
+            position_value=Decimal(position_value) if position_value else None,
+            max_leverage=int(pos.get("maxLeverage", 50)),
+        )
+        positions.append(position)
+
+    return HyperliquidAccount(
+        address=address,
+        account_value=account_value,
+        total_margin_used=total_margin,
+        withdrawable=withdrawable,
+        positions=positions,
+        timestamp=datetime.utcnow(),
+    )
+
+
+def _parse_batched_result(result: dict) -> Optional[HyperliquidAccount]:
+    """
+    Parse one rusty-req result into an account (None on any failure).
+
+    rusty-req reports the tag under "meta" and returns "response" as a
+    JSON string of {"content", "headers"}, with the body in "content".
+    """
+    address = (result.get("meta") or {}).get("tag")
+    status = result.get("http_status")
+    if not address or status != 200 or (result.get("exception") or {}).get("type"):
+        logger.warning(f"Failed to fetch {address}: HTTP {status} {result.get('exception')}")
+        return None
+
+    try:
+        response = result.get("response") or {}
+        if isinstance(response, (str, bytes)):
+            response = orjson.loads(response)
+        content = response.get("content")
+        data = orjson.loads(content) if content else None
+        if data:
+            return _parse_account_state(address, data)
+    except Exception as e:
+        logger.warning(f"Failed to parse {address}: {e}")
+    return None
+
+
+def _window_stats(window: Optional[dict]) -> tuple[float, float, float]:
+    """(pnl, roi, volume) of one leaderboard window, zeros if it is missing."""
+    if not window:
+        return 0.0, 0.0, 0.0
+    try:
+        pnl, roi, volume = _PERF_FIELDS(window)
+    except KeyError:
+        pnl, roi, volume = window.get("pnl"), window.get("roi"), window.get("vlm")
+    return float(pnl or 0), float(roi or 0), float(volume or 0)
+
+
+def _parse_leaderboard_row(row: dict) -> HyperliquidTrader:
+    """Build a HyperliquidTrader from one leaderboard row."""
+    # windowPerformances is a list of [window, stats] pairs
+    perfs = dict(row.get("windowPerformances", ()))
+
+    pnl_1d, roi_1d, volume_1d = _window_stats(perfs.get("day"))
+    pnl_7d, roi_7d, volume_7d = _window_stats(perfs.get("week"))
+    pnl_30d, roi_30d, volume_30d = _window_stats(perfs.get("month"))
+    pnl_all_time, roi_all_time, volume_all_time = _window_stats(perfs.get("allTime"))
+
+    return HyperliquidTrader(
+        address=row["ethAddress"],
+        display_name=row.get("displayName"),
+        account_value=float(row.get("accountValue") or 0),
+        # Daily
+        pnl_1d=pnl_1d,
+        roi_1d=roi_1d,
+        volume_1d=volume_1d,
+        # Weekly
+        pnl_7d=pnl_7d,
+        roi_7d=roi_7d,
+        volume_7d=volume_7d,
+        # Monthly (30d)
+        pnl_30d=pnl_30d,
+        roi_30d=roi_30d,
+        volume_30d=volume_30d,
+        # All time
+        pnl_all_time=pnl_all_time,
+        roi_all_time=roi_all_time,
+        volume_all_time=volume_all_time,
+    )
+
+
+class _AsyncChunkReader:
+    """Async file-like view of an httpx byte stream, as ijson expects."""
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes the data type with read(0) before parsing
+        if size == 0:
+            return b""
+        # Short reads are fine for ijson; b"" signals the end of the stream
+        return await anext(self._chunks, b"")
+
+
+def _filter_leaderboard(
+    traders: list[HyperliquidTrader],
+    limit: int,
+    min_account_value: float,
+    min_pnl_30d: float,
+) -> list[HyperliquidTrader]:
+    """
+    Filter a leaderboard sorted by 30d PnL (descending).
+
+    Traders meeting the PnL floor form a prefix of the list, so it is cut
+    with a binary search; the account value scan then stops as soon as
+    `limit` matches are found instead of walking all ~28k rows.
+    """
+    cutoff = bisect_right(traders, -min_pnl_30d, key=_neg_pnl_30d)
+    matches = (t for t in islice(traders, cutoff) if t.account_value >= min_account_value)
+    return list(islice(matches, limit))
+
+
+def _neg_pnl_30d(trader: HyperliquidTrader) -> float:
+    """Sort key turning the descending PnL order into ascending for bisect."""
+    return -trader.pnl_30d
 
 
 class HyperliquidTracker:
@@ -120,6 +303,12 @@ class HyperliquidTracker:
 
         # Fetch positions for multiple addresses
         accounts = await tracker.fetch_multiple_accounts(addresses)
+
+    For batch jobs, use it as an async context manager so the connection
+    pool is opened once and closed when the batch is done:
+
+        async with HyperliquidTracker() as tracker:
+            accounts = await tracker.fetch_multiple_accounts(addresses)
     """
 
     BASE_URL = "https://api.hyperliquid.xyz"
@@ -127,13 +316,24 @@ class HyperliquidTracker:
 
     # Rate limits: Hyperliquid is generally permissive
     # but we should still be respectful
-    RATE_LIMIT_DELAY = 0.1  # 100ms between requests
+    # Token bucket: bursts of up to 20 requests, refilled at 10 requests/second
+    RATE_LIMIT_BURST = 20
+    RATE_LIMIT_PER_SECOND = 10.0
     MAX_CONCURRENT = 10
 
-    # Leaderboard cache TTL (5 minutes)
-    LEADERBOARD_CACHE_TTL = 300
+    # Retry backoff: exponential with full jitter, capped; a Retry-After
+    # header on 429/503 is honored up to RETRY_AFTER_MAX
+    RETRY_BASE_DELAY = 0.5
+    RETRY_MAX_BACKOFF = 10.0
+    RETRY_AFTER_MAX = 60.0
+
+    # Leaderboard cache TTLs (stale-while-revalidate): fresh for 5 minutes,
+    # then served stale while a background refresh runs, up to 15 minutes
+    LEADERBOARD_SOFT_TTL = 300
+    LEADERBOARD_HARD_TTL = 900
 
-    # Known whale addresses (curated list - fallback if leaderboard fails)
+    # Known whale addresses (curated list - fallback if leaderboard fails).
+    # Kept lowercase, as the API expects
     KNOWN_WHALE_ADDRESSES = [
         ("0x87f9cd15f5050a9283b8896300f7c8cf69ece2cf", "TopTrader1"),  # $76M account
         ("0x50b39f20fc0387d3e69e3a7e5e26768a2ad3e8c6", "TopTrader2"),  # 379% ROI
@@ -141,6 +341,7 @@ class HyperliquidTracker:
         ("0x152e68caf43f46b2f7a0f8e98f5b82ce5c7c9dc", "TopTrader4"),  # $24M account
         ("0xb3179a9ca1b883ae8fbd0ef8a6d4b89e7e2a83ae", "TopTrader5"),  # $233M account
     ]
+    _KNOWN_WHALE_SET = frozenset(addr for addr, _ in KNOWN_WHALE_ADDRESSES)
 
     def __init__(
         self,
@@ -151,15 +352,31 @@ class HyperliquidTracker:
         self.max_retries = max_retries
         self._client: Optional[httpx.AsyncClient] = None
         self._rate_limit_lock = asyncio.Lock()
-        self._last_request_time = 0.0
+        self._tokens = float(self.RATE_LIMIT_BURST)
+        self._last_refill = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         # Leaderboard cache
         self._leaderboard_cache: list[HyperliquidTrader] = []
         self._leaderboard_cache_time: float = 0.0
+        self._leaderboard_refresh_task: Optional[asyncio.Task] = None
+        # In-flight shared fetches (single-flight), keyed by resource
+        self._inflight: dict[str, asyncio.Task] = {}
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._client is None or self._client.is_closed:
+            # HTTP/2 multiplexes concurrent requests to the same host over one
+            # connection; retries are handled in _post/_get, not the transport
             self._client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True,
+                    retries=0,
+                    limits=httpx.Limits(
+                        max_connections=50,
+                        max_keepalive_connections=20,
+                        keepalive_expiry=60,
+                    ),
+                ),
                 timeout=self.timeout,
                 headers={
                     "Content-Type": "application/json",
@@ -168,82 +385,119 @@ class HyperliquidTracker:
             )
         return self._client
 
+    async def _single_flight(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run `fetch` once for all concurrent callers of the same key.
+
+        The first caller starts the fetch as a task; callers arriving while
+        it is in flight await that same task instead of issuing their own
+        request. The task is shielded so a cancelled caller does not cancel
+        the fetch for the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
     async def _rate_limit(self):
-        """Apply rate limiting."""
-        async with self._rate_limit_lock:
-            now = asyncio.get_event_loop().time()
-            elapsed = now - self._last_request_time
-            if elapsed < self.RATE_LIMIT_DELAY:
-                await asyncio.sleep(self.RATE_LIMIT_DELAY - elapsed)
-            self._last_request_time = asyncio.get_event_loop().time()
+        """
+        Apply rate limiting (token bucket).
 
-    async def _post(self, data: dict) -> dict:
-        """Make POST request to Hyperliquid API."""
-        client = await self._get_client()
-        await self._rate_limit()
+        Each request takes a token; callers only sleep when the bucket is
+        empty, and never while holding the lock.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            loop = self._loop = asyncio.get_running_loop()
+
+        while True:
+            async with self._rate_limit_lock:
+                now = loop.time()
+                self._tokens = min(
+                    self.RATE_LIMIT_BURST,
+                    self._tokens + (now - self._last_refill) * self.RATE_LIMIT_PER_SECOND,
+                )
+                self._last_refill = now
 
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.RATE_LIMIT_PER_SECOND
+
+            await asyncio.sleep(wait)
+
+    async def _with_retries(
+        self,
+        send: Callable[[], Awaitable[httpx.Response]],
+        label: str,
+    ) -> dict:
+        """
+        Send a request with retries and decode the JSON body.
+
+        Retries sleep a random delay in [0, base * 2**attempt] (full jitter)
+        so concurrent callers that failed together do not retry together.
+        """
         for attempt in range(self.max_retries):
             try:
-                response = await client.post(
-                    f"{self.BASE_URL}/info",
-                    json=data
-                )
+                response = await send()
                 response.raise_for_status()
-                return response.json()
+                return orjson.loads(response.content)
             except httpx.HTTPStatusError as e:
                 logger.warning(
-                    f"Hyperliquid API error (attempt {attempt + 1}): "
+                    f"Hyperliquid {label} error (attempt {attempt + 1}): "
                     f"{e.response.status_code}"
                 )
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(1.0 * (attempt + 1))
-                else:
+                if attempt >= self.max_retries - 1:
                     raise
+                delay = self._backoff(attempt)
+                if e.response.status_code in (429, 503):
+                    delay = max(delay, self._retry_after(e.response))
             except httpx.RequestError as e:
                 logger.warning(
-                    f"Hyperliquid request error (attempt {attempt + 1}): {e}"
+                    f"Hyperliquid {label} request error (attempt {attempt + 1}): {e}"
                 )
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(1.0 * (attempt + 1))
-                else:
+                if attempt >= self.max_retries - 1:
                     raise
+                delay = self._backoff(attempt)
+
+            await asyncio.sleep(delay)
 
         return {}
 
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter for the given attempt."""
+        return random.uniform(0, min(self.RETRY_MAX_BACKOFF, self.RETRY_BASE_DELAY * 2 ** attempt))
+
+    def _retry_after(self, response: httpx.Response) -> float:
+        """Seconds requested by a Retry-After header (0 if absent or not numeric)."""
+        try:
+            return min(float(response.headers.get("Retry-After", 0)), self.RETRY_AFTER_MAX)
+        except ValueError:
+            return 0.0
+
+    async def _post(self, data: dict) -> dict:
+        """Make POST request to Hyperliquid API."""
+        client = await self._get_client()
+        await self._rate_limit()
+        return await self._with_retries(
+            lambda: client.post(f"{self.BASE_URL}/info", json=data),
+            "API",
+        )
+
     async def _get(self, url: str) -> dict:
         """Make GET request."""
         client = await self._get_client()
         await self._rate_limit()
-
-        for attempt in range(self.max_retries):
-            try:
-                response = await client.get(url)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                logger.warning(
-                    f"Hyperliquid GET error (attempt {attempt + 1}): "
-                    f"{e.response.status_code}"
-                )
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(1.0 * (attempt + 1))
-                else:
-                    raise
-            except httpx.RequestError as e:
-                logger.warning(
-                    f"Hyperliquid GET request error (attempt {attempt + 1}): {e}"
-                )
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(1.0 * (attempt + 1))
-                else:
-                    raise
-        return {}
+        return await self._with_retries(lambda: client.get(url), "GET")
 
     async def fetch_leaderboard(
         self,
         limit: int = 500,
-        min_account_value: Decimal = Decimal("100000"),
-        min_pnl_30d: Decimal = Decimal("0"),
+        min_account_value: float | Decimal = 100000.0,
+        min_pnl_30d: float | Decimal = 0.0,
         use_cache: bool = True
     ) -> list[HyperliquidTrader]:
         """
@@ -256,80 +510,33 @@ class HyperliquidTracker:
             limit: Maximum number of traders to return
             min_account_value: Minimum account value filter
             min_pnl_30d: Minimum 30d PnL filter (positive = profitable only)
-            use_cache: Use cached data if available and fresh
+            use_cache: Use cached data if available and not past the hard TTL
 
         Returns:
             List of HyperliquidTrader objects sorted by 30d PnL
         """
         import time
 
+        # Trader stats are floats; thresholds are only compared against them
+        min_account_value = float(min_account_value)
+        min_pnl_30d = float(min_pnl_30d)
+
         # Check cache
         if use_cache and self._leaderboard_cache:
             age = time.time() - self._leaderboard_cache_time
-            if age < self.LEADERBOARD_CACHE_TTL:
+            if age < self.LEADERBOARD_HARD_TTL:
+                if age >= self.LEADERBOARD_SOFT_TTL and self._leaderboard_refresh_task is None:
+                    # Stale: serve it now and refresh in the background
+                    self._leaderboard_refresh_task = asyncio.create_task(self._refresh_leaderboard())
                 logger.debug(f"Using cached leaderboard (age: {age:.0f}s)")
                 # Apply filters to cached data
-                filtered = [
-                    t for t in self._leaderboard_cache
-                    if t.account_value >= min_account_value
-                    and t.pnl_30d >= min_pnl_30d
-                ]
-                return filtered[:limit]
-
-        try:
-            data = await self._get(self.LEADERBOARD_URL)
-            rows = data.get("leaderboardRows", [])
-
-            traders = []
-            for row in rows:
-                # Parse window performances
-                perfs = {p[0]: p[1] for p in row.get("windowPerformances", [])}
-
-                day = perfs.get("day", {})
-                week = perfs.get("week", {})
-                month = perfs.get("month", {})
-                all_time = perfs.get("allTime", {})
-
-                trader = HyperliquidTrader(
-                    address=row["ethAddress"],
-                    display_name=row.get("displayName"),
-                    account_value=Decimal(str(row.get("accountValue", "0"))),
-                    # Daily
-                    pnl_1d=Decimal(str(day.get("pnl", "0"))),
-                    roi_1d=Decimal(str(day.get("roi", "0"))),
-                    volume_1d=Decimal(str(day.get("vlm", "0"))),
-                    # Weekly
-                    pnl_7d=Decimal(str(week.get("pnl", "0"))),
-                    roi_7d=Decimal(str(week.get("roi", "0"))),
-                    volume_7d=Decimal(str(week.get("vlm", "0"))),
-                    # Monthly (30d)
-                    pnl_30d=Decimal(str(month.get("pnl", "0"))),
-                    roi_30d=Decimal(str(month.get("roi", "0"))),
-                    volume_30d=Decimal(str(month.get("vlm", "0"))),
-                    # All time
-                    pnl_all_time=Decimal(str(all_time.get("pnl", "0"))),
-                    roi_all_time=Decimal(str(all_time.get("roi", "0"))),
-                    volume_all_time=Decimal(str(all_time.get("vlm", "0"))),
+                return _filter_leaderboard(
+                    self._leaderboard_cache, limit, min_account_value, min_pnl_30d
                 )
-                traders.append(trader)
-
-            # Sort by 30d PnL (descending)
-            traders.sort(key=lambda t: t.pnl_30d, reverse=True)
-
-            # Update cache with full unfiltered data
-            self._leaderboard_cache = traders
-            self._leaderboard_cache_time = time.time()
 
-            logger.info(f"Fetched {len(traders)} traders from Hyperliquid leaderboard")
-
-            # Apply filters
-            filtered = [
-                t for t in traders
-                if t.account_value >= min_account_value
-                and t.pnl_30d >= min_pnl_30d
-            ]
-
-            return filtered[:limit]
+        try:
+            traders = await self._single_flight("leaderboard", self._load_leaderboard)
+            return _filter_leaderboard(traders, limit, min_account_value, min_pnl_30d)
 
         except Exception as e:
             logger.error(f"Error fetching Hyperliquid leaderboard: {e}")
@@ -339,11 +546,66 @@ class HyperliquidTracker:
                 return self._leaderboard_cache[:limit]
             return []
 
+    async def _refresh_leaderboard(self) -> None:
+        """Background stale-while-revalidate refresh of the leaderboard cache."""
+        try:
+            await self._single_flight("leaderboard", self._load_leaderboard)
+        except Exception as e:
+            logger.warning(f"Background Hyperliquid leaderboard refresh failed: {e}")
+        finally:
+            self._leaderboard_refresh_task = None
+
+    async def _stream_leaderboard_rows(self) -> AsyncIterator[dict]:
+        """
+        Yield leaderboard rows as they are parsed off the response stream.
+
+        Only one row dict is alive at a time, so the multi-MB payload is
+        never materialized next to the trader list built from it.
+        """
+        client = await self._get_client()
+        await self._rate_limit()
+
+        async with client.stream("GET", self.LEADERBOARD_URL) as response:
+            response.raise_for_status()
+            reader = _AsyncChunkReader(response.aiter_bytes())
+            async for row in ijson.items_async(reader, "leaderboardRows.item"):
+                yield row
+
+    async def _load_leaderboard(self) -> list[HyperliquidTrader]:
+        """Fetch and parse the full leaderboard, and refresh the cache with it."""
+        import time
+
+        traders: Optional[list[HyperliquidTrader]] = None
+        if IJSON_AVAILABLE:
+            try:
+                traders = [
+                    _parse_leaderboard_row(row)
+                    async for row in self._stream_leaderboard_rows()
+                ]
+            except Exception as e:
+                logger.warning(f"Streaming leaderboard parse failed, refetching: {e}")
+
+        if traders is None:
+            data = await self._get(self.LEADERBOARD_URL)
+            traders = [_parse_leaderboard_row(row) for row in data.get("leaderboardRows", [])]
+
+        # Sort by 30d PnL (descending). This runs once per refresh; every
+        # filtered read then bisects the cached order, which is cheaper than
+        # a per-call heapq.nlargest pass over all rows
+        traders.sort(key=lambda t: t.pnl_30d, reverse=True)
+
+        # Update cache with full unfiltered data
+        self._leaderboard_cache = traders
+        self._leaderboard_cache_time = time.time()
+
+        logger.info(f"Fetched {len(traders)} traders from Hyperliquid leaderboard")
+        return traders
+
     async def discover_top_traders(
         self,
         limit: int = 100,
-        min_account_value: Decimal = Decimal("500000"),
-        min_roi_30d: Decimal = Decimal("0.05"),  # 5%+
+        min_account_value: float | Decimal = 500000.0,
+        min_roi_30d: float | Decimal = 0.05,  # 5%+
         only_profitable: bool = True
     ) -> list[HyperliquidTrader]:
         """
@@ -363,7 +625,8 @@ class HyperliquidTracker:
         Returns:
             List of qualified traders
         """
-        min_pnl = Decimal("0") if only_profitable else Decimal("-999999999")
+        min_roi_30d = float(min_roi_30d)
+        min_pnl = 0.0 if only_profitable else float("-inf")
 
         traders = await self.fetch_leaderboard(
             limit=limit * 2,  # Fetch extra to filter
@@ -380,14 +643,14 @@ class HyperliquidTracker:
 
         logger.info(
             f"Discovered {len(qualified)} qualified Hyperliquid traders "
-            f"(min ${min_account_value}, min ROI {float(min_roi_30d)*100:.1f}%)"
+            f"(min ${min_account_value}, min ROI {min_roi_30d*100:.1f}%)"
         )
 
         return qualified[:limit]
 
     async def get_meta(self) -> dict:
         """Get Hyperliquid market metadata."""
-        return await self._post({"type": "meta"})
+        return await self._single_flight("meta", lambda: self._post({"type": "meta"}))
 
     async def get_account_state(
         self,
@@ -404,58 +667,20 @@ class HyperliquidTracker:
         Returns:
             HyperliquidAccount with positions or None if error
         """
+        # Known whales are stored lowercase already
+        user = address if address in self._KNOWN_WHALE_SET else address.lower()
+
         try:
             data = await self._post({
                 "type": "clearinghouseState",
-                "user": address.lower(),
+                "user": user,
                 "dex": dex
             })
 
             if not data:
                 return None
 
-            # Parse margin summary
-            margin = data.get("marginSummary", {})
-            account_value = Decimal(str(margin.get("accountValue", "0")))
-            total_margin = Decimal(str(margin.get("totalMarginUsed", "0")))
-            withdrawable = Decimal(str(data.get("withdrawable", "0")))
-
-            # Parse positions
-            positions = []
-            for pos_data in data.get("assetPositions", []):
-                pos = pos_data.get("position", {})
-                if not pos:
-                    continue
-
-                # Size is signed: positive = long, negative = short
-                size = Decimal(str(pos.get("szi", "0")))
-                if size == 0:
-                    continue  # Skip zero positions
-
-                leverage_info = pos.get("leverage", {})
-
-                position = HyperliquidPosition(
-                    coin=pos.get("coin", ""),
-                    size=size,
-                    entry_price=Decimal(str(pos.get("entryPx", "0"))),
-                    leverage=int(leverage_info.get("value", 1)),
-                    leverage_type=leverage_info.get("type", "cross"),
-                    unrealized_pnl=Decimal(str(pos.get("unrealizedPnl", "0"))),
-                    margin_used=Decimal(str(pos.get("marginUsed", "0"))),
-                    liquidation_price=Decimal(str(pos.get("liquidationPx", "0"))) if pos.get("liquidationPx") else None,
-                    position_value=Decimal(str(pos.get("positionValue", "0"))) if pos.get("positionValue") else None,
-                    max_leverage=int(pos.get("maxLeverage", 50)),
-                )
-                positions.append(position)
-
-            return HyperliquidAccount(
-                address=address,
-                account_value=account_value,
-                total_margin_used=total_margin,
-                withdrawable=withdrawable,
-                positions=positions,
-                timestamp=datetime.utcnow(),
-            )
+            return _parse_account_state(address, data)
 
         except Exception as e:
             logger.error(f"Error fetching Hyperliquid account {address}: {e}")
@@ -483,6 +708,8 @@ class HyperliquidTracker:
         """
         Fetch account states for multiple addresses concurrently.
 
+        Duplicate addresses (in any case) are fetched once.
+
         Args:
             addresses: List of wallet addresses
             max_concurrent: Max concurrent requests (default: self.MAX_CONCURRENT)
@@ -490,22 +717,92 @@ class HyperliquidTracker:
         Returns:
             List of HyperliquidAccount objects (excluding errors)
         """
-        max_concurrent = max_concurrent or self.MAX_CONCURRENT
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def fetch_with_semaphore(address: str):
-            async with semaphore:
-                return await self.get_account_state(address)
+        # Merged lists (leaderboard + known whales + watchlists) often repeat
+        # addresses; keep the first occurrence, in order
+        addresses = list(dict.fromkeys(addr.lower() for addr in addresses))
 
-        tasks = [fetch_with_semaphore(addr) for addr in addresses]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        if RUSTY_REQ_AVAILABLE and addresses:
+            try:
+                accounts = await self._fetch_multiple_accounts_batched(addresses)
+                if accounts:
+                    return accounts
+                logger.warning("rusty-req batch returned no accounts, falling back to httpx")
+            except Exception as e:
+                logger.warning(f"rusty-req batch failed, falling back to httpx: {e}")
+
+        # Create the client once up front; every request below then shares
+        # its pooled HTTP/2 connection instead of racing to set it up
+        await self._get_client()
+
+        # A fixed pool of workers drains a shared iterator, so only
+        # max_concurrent coroutines exist however long the address list is
+        max_concurrent = min(max_concurrent or self.MAX_CONCURRENT, len(addresses))
+        pending = iter(enumerate(addresses))
+        results: list[Optional[HyperliquidAccount]] = [None] * len(addresses)
+
+        async def worker():
+            for index, address in pending:
+                try:
+                    results[index] = await self.get_account_state(address)
+                except Exception as e:
+                    logger.warning(f"Failed to fetch {address}: {e}")
+
+        await asyncio.gather(*(worker() for _ in range(max_concurrent)))
+
+        return [account for account in results if account is not None]
+
+    async def _fetch_multiple_accounts_batched(
+        self,
+        addresses: list[str],
+    ) -> list[HyperliquidAccount]:
+        """
+        Fetch account states in rusty-req batches (Tokio + reqwest).
+
+        The fanout runs in Rust, so Python only builds the request items
+        and parses the returned bodies. Batches are capped at the rate-limit
+        burst and take their tokens just before sending, so the batch path
+        is paced like the httpx one. Returns [] if the first batch parses
+        nothing, letting the caller fall back to httpx without having
+        drained the bucket for the whole list.
+        """
+        url = f"{self.BASE_URL}/info"
+        batch_size = self.RATE_LIMIT_BURST
+        accounts: list[HyperliquidAccount] = []
+
+        for start in range(0, len(addresses), batch_size):
+            batch = addresses[start:start + batch_size]
+            for _ in batch:
+                await self._rate_limit()
+
+            items = [
+                rusty_req.RequestItem(
+                    url=url,
+                    method="POST",
+                    # POST params are sent as the JSON body
+                    params={
+                        "type": "clearinghouseState",
+                        "user": address if address in self._KNOWN_WHALE_SET else address.lower(),
+                        "dex": "",
+                    },
+                    tag=address,
+                    timeout=self.timeout,
+                )
+                for address in batch
+            ]
+            results = await rusty_req.fetch_requests(
+                items,
+                total_timeout=self.timeout,
+                mode=rusty_req.ConcurrencyMode.SELECT_ALL,
+            )
 
-        accounts = []
-        for addr, result in zip(addresses, results):
-            if isinstance(result, Exception):
-                logger.warning(f"Failed to fetch {addr}: {result}")
-            elif result is not None:
-                accounts.append(result)
+            parsed = [
+                account
+                for account in map(_parse_batched_result, results)
+                if account is not None
+            ]
+            if not parsed and start == 0:
+                return []
+            accounts.extend(parsed)
 
         return accounts
 
@@ -549,23 +846,50 @@ class HyperliquidTracker:
 
         return active_whales
 
+    async def __aenter__(self) -> "HyperliquidTracker":
+        await self._get_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
     async def close(self):
-        """Close HTTP client."""
+        """
+        Close HTTP client.
+
+        This drops the connection pool, so a later request pays for a new
+        TLS handshake; idle connections are already recycled by the pool's
+        keepalive expiry, so there is no need to close between batches.
+        """
         if self._client and not self._client.is_closed:
             await self._client.aclose()
             self._client = None
 
 
-# Convenience functions for use without instantiating class
+# Convenience functions for use without instantiating class.
+# Trackers are kept per event loop: the HTTP client and locks are bound to the
+# loop they were first used on, and an entry goes away with its loop
+_trackers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, HyperliquidTracker] = (
+    weakref.WeakKeyDictionary()
+)
 _default_tracker: Optional[HyperliquidTracker] = None
 
 
 def get_tracker() -> HyperliquidTracker:
-    """Get or create default tracker instance."""
+    """Get or create the tracker for the running event loop."""
     global _default_tracker
-    if _default_tracker is None:
-        _default_tracker = HyperliquidTracker()
-    return _default_tracker
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Called outside a loop: fall back to a process-wide instance
+        if _default_tracker is None:
+            _default_tracker = HyperliquidTracker()
+        return _default_tracker
+
+    tracker = _trackers.get(loop)
+    if tracker is None:
+        tracker = _trackers[loop] = HyperliquidTracker()
+    return tracker
 
 
 async def fetch_hyperliquid_positions(address: str) -> Optional[HyperliquidAccount]:
@@ -582,7 +906,7 @@ async def fetch_hyperliquid_whales() -> list[HyperliquidAccount]:
 
 async def fetch_hyperliquid_leaderboard(
     limit: int = 100,
-    min_account_value: Decimal = Decimal("100000")
+    min_account_value: float = 100000.0
 ) -> list[HyperliquidTrader]:
     """Convenience function to fetch leaderboard traders."""
     tracker = get_tracker()
@@ -600,5 +924,5 @@ async def discover_hyperliquid_top_traders(
     tracker = get_tracker()
     return await tracker.discover_top_traders(
         limit=limit,
-        min_roi_30d=Decimal(str(min_roi_30d))
+        min_roi_30d=min_roi_30d
     )
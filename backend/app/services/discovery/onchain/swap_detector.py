@@ -11,15 +11,22 @@ Supported DEXes:
 """
 
 import logging
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from app.models.signal import SignalAction
 
 logger = logging.getLogger(__name__)
 
+# Decimal constants for the per-swap amount conversion
+_WEI_PER_ETH = Decimal(10) ** 18
+_ZERO = Decimal(0)
+
+_fromtimestamp = datetime.fromtimestamp
+
 # Known DEX router addresses by chain
 DEX_ROUTERS = {
     "ETHEREUM": {
@@ -90,6 +97,20 @@ STABLECOINS = {
     },
 }
 
+# Flat lowercase router address -> (chain, dex_id, dex_name), built once.
+# Keys are interned; an address listed on several chains keeps the last entry
+_ROUTER_LOOKUP: dict[str, tuple[str, str, str]] = {
+    sys.intern(addr.lower()): (chain, dex_id, dex_name)
+    for chain, routers in DEX_ROUTERS.items()
+    for addr, (dex_id, dex_name) in routers.items()
+}
+
+# Lowercase stablecoin addresses per chain, for membership checks
+_STABLES_BY_CHAIN: dict[str, frozenset[str]] = {
+    chain: frozenset(addr.lower() for addr in tokens)
+    for chain, tokens in STABLECOINS.items()
+}
+
 # Method signatures for swap detection
 SWAP_SIGNATURES = {
     # Uniswap V2
@@ -110,13 +131,37 @@ SWAP_SIGNATURES = {
     "0x2e95b6c8": "unoswap",
 }
 
+# Selector -> (method name, action), resolved once at import:
+# swapExact*ForTokens / exactInput* = BUY (buying tokens), anything else = SELL
+SWAP_SIG_TABLE: dict[str, tuple[str, SignalAction]] = {
+    sig: (
+        name,
+        SignalAction.BUY if "ForTokens" in name or "Input" in name else SignalAction.SELL,
+    )
+    for sig, name in SWAP_SIGNATURES.items()
+}
+
+# Known selectors as lowercase hex strings, for the batch prefilter
+_SWAP_SELECTORS = frozenset(SWAP_SIG_TABLE)
+
+# First selector byte -> 1 if any known swap selector starts with it
+_SWAP_FIRST_BYTE = bytearray(256)
+for _sig in SWAP_SIGNATURES:
+    _SWAP_FIRST_BYTE[int(_sig[2:4], 16)] = 1
+del _sig
 
-@dataclass
+# The same table keyed by the raw 4-byte selector (case-insensitive on input)
+_SWAP_SIG_BYTES: dict[bytes, tuple[str, SignalAction]] = {
+    bytes.fromhex(sig[2:]): entry for sig, entry in SWAP_SIG_TABLE.items()
+}
+
+
+@dataclass(slots=True, frozen=True)
 class SwapInfo:
     """Information about a detected DEX swap."""
     tx_hash: str
     block_number: int
-    timestamp: datetime
+    timestamp_unix: int  # Block time (unix seconds); see `timestamp`
     wallet_address: str
     chain: str
 
@@ -138,6 +183,11 @@ class SwapInfo:
     # Derived signal info
     action: SignalAction  # BUY or SELL (based on token_out)
 
+    @property
+    def timestamp(self) -> datetime:
+        """Block time as a local datetime, built on access."""
+        return _fromtimestamp(self.timestamp_unix)
+
     def __repr__(self) -> str:
         return (
             f"<SwapInfo(tx={self.tx_hash[:10]}..., "
@@ -156,20 +206,13 @@ class SwapDetector:
     - Internal transactions
     """
 
-    def __init__(self):
-        # Build reverse lookup for router addresses
-        self._router_lookup = {}
-        for chain, routers in DEX_ROUTERS.items():
-            for addr, (dex_id, dex_name) in routers.items():
-                self._router_lookup[addr.lower()] = (chain, dex_id, dex_name)
-
     def is_dex_router(self, address: str) -> bool:
         """Check if address is a known DEX router."""
-        return address.lower() in self._router_lookup
+        return address.lower() in _ROUTER_LOOKUP
 
     def get_dex_info(self, address: str) -> tuple[str, str, str] | None:
         """Get DEX info for a router address."""
-        return self._router_lookup.get(address.lower())
+        return _ROUTER_LOOKUP.get(address.lower())
 
     def detect_swap_from_tx(
         self,
@@ -186,93 +229,117 @@ class SwapDetector:
         Returns:
             SwapInfo if swap detected, None otherwise
         """
-        to_address = tx.get("to", "").lower()
         input_data = tx.get("input", "")
-        method_sig = input_data[:10] if len(input_data) >= 10 else ""
 
-        # Check if it's a DEX router
-        dex_info = self.get_dex_info(to_address)
+        # Reject plain transfers and calls whose selector cannot be a swap
+        # on the first byte, before touching the address
+        try:
+            if len(input_data) < 10 or not _SWAP_FIRST_BYTE[int(input_data[2:4], 16)]:
+                return None
+            selector = bytes.fromhex(input_data[2:10])
+        except ValueError:
+            return None
+
+        # Check if it's a DEX router (keys are already lowercase)
+        to_address = (tx.get("to") or "").lower()
+        dex_info = _ROUTER_LOOKUP.get(to_address)
         if not dex_info:
             return None
 
         chain_name, dex_id, dex_name = dex_info
 
         # Check if it's a swap method
-        method_name = SWAP_SIGNATURES.get(method_sig)
-        if not method_name:
+        entry = _SWAP_SIG_BYTES.get(selector)
+        if entry is None:
             # Could still be a swap via different method
             # For now, only detect known methods
             return None
+        method_name, action = entry
 
+        # Parse basic transaction info; only the numeric casts can fail
         try:
-            # Parse basic transaction info
-            tx_hash = tx.get("hash", "")
-            block_number = int(tx.get("blockNumber", 0))
-            timestamp = datetime.fromtimestamp(int(tx.get("timeStamp", 0)))
-            wallet_address = tx.get("from", "").lower()
-
-            # For full swap details, we'd need to decode the input data
-            # and/or parse event logs. This is a simplified version.
-
+            block_number = int(tx.get("blockNumber") or 0)
+            timestamp_unix = int(tx.get("timeStamp") or 0)
             # Estimate amount from transaction value (for ETH swaps)
-            value_wei = int(tx.get("value", 0))
-            gas_used = int(tx.get("gasUsed", 0))
-            gas_price = int(tx.get("gasPrice", 0))
-
-            # Determine action based on method
-            # swapExact*ForTokens = BUY (buying tokens)
-            # swapTokensForExact* = SELL (selling tokens)
-            if "ForTokens" in method_name or "Input" in method_name:
-                action = SignalAction.BUY
-            else:
-                action = SignalAction.SELL
-
-            # Create swap info (with placeholder values for tokens)
-            # Full implementation would decode input data
-            swap_info = SwapInfo(
-                tx_hash=tx_hash,
-                block_number=block_number,
-                timestamp=timestamp,
-                wallet_address=wallet_address,
-                chain=chain,
-                dex=dex_id,
-                dex_name=dex_name,
-                token_in="",  # Would need decoding
-                token_in_symbol=None,
-                token_in_amount=Decimal(str(value_wei)) / Decimal("1e18") if value_wei else Decimal("0"),
-                token_out="",  # Would need decoding
-                token_out_symbol=None,
-                token_out_amount=Decimal("0"),
-                amount_usd=None,  # Would need price lookup
-                action=action,
-            )
-
-            return swap_info
-
-        except Exception as e:
+            value_wei = int(tx.get("value") or 0)
+        except (TypeError, ValueError) as e:
             logger.error(f"Error detecting swap from tx {tx.get('hash')}: {e}")
             return None
 
+        # For full swap details, we'd need to decode the input data
+        # and/or parse event logs. This is a simplified version.
+        # Create swap info (with placeholder values for tokens)
+        return SwapInfo(
+            tx_hash=tx.get("hash") or "",
+            block_number=block_number,
+            timestamp_unix=timestamp_unix,
+            wallet_address=(tx.get("from") or "").lower(),
+            chain=chain,
+            dex=dex_id,
+            dex_name=dex_name,
+            token_in="",  # Would need decoding
+            token_in_symbol=None,
+            token_in_amount=Decimal(value_wei) / _WEI_PER_ETH if value_wei > 0 else _ZERO,
+            token_out="",  # Would need decoding
+            token_out_symbol=None,
+            token_out_amount=_ZERO,
+            amount_usd=None,  # Would need price lookup
+            action=action,
+        )
+
     def detect_swaps_from_transactions(
         self,
         transactions: list[dict],
         chain: str,
     ) -> list[SwapInfo]:
-        """Detect all swaps from a list of transactions."""
-        swaps = []
+        """
+        Detect all swaps from a list of transactions.
+
+        Works in two passes: a filter pass keeps only transactions sent to
+        a DEX router with a known swap selector (two hash lookups per row,
+        which reject most of a wallet's history), then SwapInfo objects
+        are built for the few remaining matches.
+        """
+        routers = _ROUTER_LOOKUP
+        selectors = _SWAP_SELECTORS
+
+        candidates = [
+            tx for tx in transactions
+            if (tx.get("to") or "").lower() in routers
+            and tx.get("input", "")[:10].lower() in selectors
+        ]
 
-        for tx in transactions:
-            swap = self.detect_swap_from_tx(tx, chain)
+        swaps = []
+        detect = self.detect_swap_from_tx
+        for tx in candidates:
+            swap = detect(tx, chain)
             if swap:
                 swaps.append(swap)
 
         logger.debug(f"Detected {len(swaps)} swaps from {len(transactions)} transactions")
         return swaps
 
+    async def detect_swaps_stream(
+        self,
+        tx_iter: AsyncIterator[dict],
+        chain: str,
+    ) -> AsyncIterator[SwapInfo]:
+        """
+        Detect swaps from an async stream of transactions.
+
+        Yields each SwapInfo as soon as its transaction arrives, so paginated
+        history (see EtherscanDiscovery.iter_wallet_transactions) is filtered
+        while the next page is still being fetched.
+        """
+        detect = self.detect_swap_from_tx
+        async for tx in tx_iter:
+            swap = detect(tx, chain)
+            if swap:
+                yield swap
+
     def is_stablecoin(self, token_address: str, chain: str) -> bool:
         """Check if token is a stablecoin."""
-        stables = STABLECOINS.get(chain, {})
-        return token_address.lower() in {addr.lower() for addr in stables.keys()}
+        return token_address.lower() in _STABLES_BY_CHAIN.get(chain, frozenset())
 
     def determine_signal_action(
         self,
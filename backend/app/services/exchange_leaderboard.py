@@ -4,13 +4,19 @@ Fetches real top traders from exchange leaderboards (Binance, Bybit, OKX)
 """
 
 import asyncio
+import json
 import logging
+import time
 from dataclasses import dataclass
-from decimal import Decimal
-from typing import Any
+from functools import lru_cache
+from decimal import Decimal, InvalidOperation
+from heapq import nlargest
+from operator import attrgetter
+from typing import Any, Awaitable, Callable, Optional
 
 import httpx
-from sqlalchemy import select, update
+import orjson
+from sqlalchemy import func
 from sqlalchemy.dialects.postgresql import insert
 
 from app.config import get_settings
@@ -20,8 +26,87 @@ from app.models.whale import Whale, WhaleChain, WhaleStats
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Shared zero for stats an exchange does not report
+_ZERO = Decimal(0)
+_ONE = Decimal(1)
+_HUNDRED = Decimal(100)
+
+# Win-rate estimate from 7d ROI: 55% baseline, +1 point per 5% ROI, clamped to 45-85%
+_WIN_RATE_BASE = Decimal(55)
+_WIN_RATE_ROI_STEP = Decimal(5)
+_WIN_RATE_MIN = Decimal(45)
+_WIN_RATE_MAX = Decimal(85)
+
+# Errors a malformed leaderboard row can raise while parsing (missing or
+# non-numeric fields, non-dict entries); such rows are skipped
+_ROW_ERRORS = (KeyError, ValueError, TypeError, AttributeError, InvalidOperation)
+
+# Ranking key for traders merged across exchanges
+_BY_ROI_7D = attrgetter("roi_7d")
+
+# Alternative field names used by the copy trading APIs, in lookup order
+_BYBIT_UID = ("leaderMark", "leaderId")
+_BYBIT_ROI_7D = ("roi7D", "roi7d")
+_BYBIT_ROI_30D = ("roi30D", "roi30d")
+_BYBIT_PNL_7D = ("pnl7D", "pnl7d")
+_BYBIT_FOLLOWERS = ("followerNum", "currentFollowerNum")
+
+_BITGET_UID = ("traderUid", "traderId")
+_BITGET_NAME = ("traderName", "nickName")
+_BITGET_ROI_7D = ("weekRoi", "roiWeek")
+_BITGET_ROI_30D = ("monthRoi", "roiMonth")
+_BITGET_PNL_7D = ("weekPnl", "pnlWeek")
+_BITGET_TRADES = ("totalTrade", "tradeCount")
+_BITGET_FOLLOWERS = ("followerCount", "copyCount")
+
+
+def _dec(value: Any) -> Decimal:
+    """
+    Convert a JSON number/string to Decimal.
+
+    Strings and ints convert directly; floats go through str() so that
+    0.1 stays Decimal("0.1") rather than its exact binary expansion.
+    """
+    if isinstance(value, (str, int)):
+        return Decimal(value)
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+
+def _to_percent(value: Decimal) -> Decimal:
+    """Normalize a rate that may be a fraction (0.55) or a percentage (55) to a percentage."""
+    return value * _HUNDRED if value <= _ONE else value
+
+
+@lru_cache(maxsize=None)
+def _exchange_keys(exchange: str) -> tuple[str, str]:
+    """Whale wallet-address prefix and tags for an exchange (a handful of values)."""
+    return f"{exchange.lower()}_", f"{exchange},TOP_TRADER,LEADERBOARD"
+
+
+def _first_of(item: dict, keys: tuple[str, ...], default: Any = None) -> Any:
+    """Value of the first key present (and not null) in `item`."""
+    for key in keys:
+        value = item.get(key)
+        if value is not None:
+            return value
+    return default
+
+
+# WhaleStats columns refreshed on every leaderboard sync
+_STATS_COLUMNS = (
+    "win_rate",
+    "profit_7d",
+    "profit_30d",
+    "profit_90d",
+    "total_profit_usd",
+    "total_trades",
+    "avg_profit_percent",
+)
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TopTrader:
     """Represents a top trader from exchange leaderboard."""
 
@@ -50,17 +135,98 @@ class ExchangeLeaderboardService:
     - OKX Copy Trading
     """
 
+    # Response cache TTLs (seconds): leaderboards change slowly, and a
+    # trader's detail stats even more so
+    LIST_CACHE_TTL = 60
+    DETAILS_CACHE_TTL = 300
+    # Response cache size that triggers pruning (details keys are per
+    # trader, and traders rotate through the leaderboards)
+    MAX_CACHE_ENTRIES = 2048
+
+    # Concurrent Binance detail requests per batch (keeps clear of rate limits)
+    DETAILS_CONCURRENCY = 10
+
     def __init__(self):
+        # Exchanges are fetched in parallel; HTTP/2 multiplexes requests to
+        # the same host (e.g. Binance list + detail calls) over one connection
         self.client = httpx.AsyncClient(
-            timeout=30.0,
+            timeout=httpx.Timeout(30.0, connect=10.0),
+            http2=True,
+            # Long-lived (shared) client: keep idle connections around between
+            # the list and detail calls of a sync instead of the 5s default
+            limits=httpx.Limits(
+                max_connections=32, max_keepalive_connections=16, keepalive_expiry=60.0
+            ),
             headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+                "Accept": "application/json",
             }
         )
+        # (endpoint + request params) -> (fetched at, parsed JSON body),
+        # kept in fetch order so the oldest entries come first
+        self._cache: dict[str, tuple[float, Any]] = {}
+        # Requests currently in flight, shared by concurrent callers
+        self._inflight: dict[str, asyncio.Task] = {}
 
     async def close(self):
         await self.client.aclose()
 
+    async def _cached_json(
+        self,
+        url: str,
+        request: dict,
+        ttl: float,
+        send: Callable[[], Awaitable[httpx.Response]],
+        label: str,
+    ) -> Any | None:
+        """
+        Return the parsed JSON for a request, reusing a response younger than `ttl`.
+
+        Only successful (200) responses are cached; on any other status a
+        warning is logged and None is returned. Concurrent misses for the
+        same key share one request (single-flight).
+        """
+        key = f"{url} {json.dumps(request, sort_keys=True)}"
+        hit = self._cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < ttl:
+            return hit[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_json(key, send, label))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so one cancelled caller does not cancel it for the others
+        return await asyncio.shield(task)
+
+    async def _fetch_json(
+        self,
+        key: str,
+        send: Callable[[], Awaitable[httpx.Response]],
+        label: str,
+    ) -> Any | None:
+        """Send a request and cache its parsed body under `key` if it succeeded."""
+        response = await send()
+        if response.status_code != 200:
+            logger.warning(f"{label} API returned {response.status_code}")
+            return None
+
+        data = orjson.loads(response.content)
+        now = time.monotonic()
+        # Re-insert so the dict stays ordered by fetch time
+        self._cache.pop(key, None)
+        self._cache[key] = (now, data)
+        if len(self._cache) > self.MAX_CACHE_ENTRIES:
+            self._prune_cache(now)
+        return data
+
+    def _prune_cache(self, now: float) -> None:
+        """Drop entries past the longest TTL, then the oldest ones beyond the size cap."""
+        for key, (fetched_at, _) in list(self._cache.items()):
+            if now - fetched_at < self.DETAILS_CACHE_TTL and len(self._cache) <= self.MAX_CACHE_ENTRIES:
+                break
+            del self._cache[key]
+
     async def fetch_all_top_traders(self, limit: int = 100) -> list[TopTrader]:
         """Fetch top traders from all supported exchanges."""
         all_traders = []
@@ -79,9 +245,8 @@ class ExchangeLeaderboardService:
             else:
                 all_traders.extend(result)
 
-        # Sort by ROI and return top performers
-        all_traders.sort(key=lambda x: x.roi_7d, reverse=True)
-        return all_traders[:limit]
+        # Top performers by ROI (partial sort, ties keep fetch order)
+        return nlargest(limit, all_traders, key=_BY_ROI_7D)
 
     async def fetch_binance_leaderboard(self, limit: int = 50) -> list[TopTrader]:
         """
@@ -102,37 +267,38 @@ class ExchangeLeaderboardService:
                 "tradeType": "PERPETUAL"
             }
 
-            response = await self.client.post(url, json=payload)
-
-            if response.status_code != 200:
-                logger.warning(f"Binance leaderboard API returned {response.status_code}")
+            data = await self._cached_json(
+                url, payload, self.LIST_CACHE_TTL,
+                lambda: self.client.post(url, json=payload),
+                "Binance leaderboard",
+            )
+            if data is None:
                 return traders
 
-            data = response.json()
             rank_list = data.get("data", [])
 
-            for i, item in enumerate(rank_list[:limit]):
+            for rank, item in enumerate(rank_list[:limit], 1):
                 try:
                     # API returns "value" field which is ROI multiplier (e.g., 3.5 = 350% ROI)
-                    roi_value = Decimal(str(item.get("value", 0))) * 100  # Convert to percentage
+                    roi_value = _dec(item.get("value", 0)) * _HUNDRED  # Convert to percentage
 
                     trader = TopTrader(
                         uid=str(item.get("encryptedUid", "")),
-                        nickname=item.get("nickName", f"Binance Trader #{i+1}"),
+                        nickname=item.get("nickName", f"Binance Trader #{rank}"),
                         exchange="BINANCE",
                         roi_7d=roi_value,
                         roi_30d=roi_value,  # Same as 7d for now
-                        roi_90d=Decimal("0"),
-                        pnl_7d=Decimal(str(item.get("pnl", 0))),
-                        pnl_30d=Decimal("0"),
-                        pnl_total=Decimal("0"),
-                        win_rate=Decimal("0"),  # Not available in basic response
+                        roi_90d=_ZERO,
+                        pnl_7d=_dec(item.get("pnl", 0)),
+                        pnl_30d=_ZERO,
+                        pnl_total=_ZERO,
+                        win_rate=_ZERO,  # Not available in basic response
                         total_trades=0,
                         followers_count=int(item.get("followerCount", 0)),
-                        rank=int(item.get("rank", i + 1))  # Use actual rank from API
+                        rank=int(item.get("rank", rank))  # Use actual rank from API
                     )
                     traders.append(trader)
-                except Exception as e:
+                except _ROW_ERRORS as e:
                     logger.warning(f"Error parsing Binance trader: {e}")
 
             logger.info(f"Fetched {len(traders)} traders from Binance leaderboard")
@@ -152,10 +318,12 @@ class ExchangeLeaderboardService:
                 "tradeType": "PERPETUAL"
             }
 
-            response = await self.client.post(url, json=payload)
-
-            if response.status_code == 200:
-                data = response.json()
+            data = await self._cached_json(
+                url, payload, self.DETAILS_CACHE_TTL,
+                lambda: self.client.post(url, json=payload),
+                "Binance trader details",
+            )
+            if data is not None:
                 return data.get("data", {})
 
         except Exception as e:
@@ -163,6 +331,25 @@ class ExchangeLeaderboardService:
 
         return None
 
+    async def fetch_binance_trader_details_batch(
+        self, encrypted_uids: list[str]
+    ) -> dict[str, dict | None]:
+        """
+        Fetch detailed stats for many Binance traders concurrently.
+
+        Returns:
+            Dict of encrypted uid -> details (None where the fetch failed)
+        """
+        uids = list(dict.fromkeys(encrypted_uids))
+        semaphore = asyncio.Semaphore(self.DETAILS_CONCURRENCY)
+
+        async def fetch_with_semaphore(encrypted_uid: str) -> dict | None:
+            async with semaphore:
+                return await self.fetch_binance_trader_details(encrypted_uid)
+
+        results = await asyncio.gather(*(fetch_with_semaphore(uid) for uid in uids))
+        return dict(zip(uids, results))
+
     async def fetch_bybit_copy_traders(self, limit: int = 50) -> list[TopTrader]:
         """
         Fetch Bybit copy trading master traders.
@@ -180,35 +367,36 @@ class ExchangeLeaderboardService:
                 "sortType": "desc"
             }
 
-            response = await self.client.get(url, params=params)
-
-            if response.status_code != 200:
-                logger.warning(f"Bybit copy trading API returned {response.status_code}")
+            data = await self._cached_json(
+                url, params, self.LIST_CACHE_TTL,
+                lambda: self.client.get(url, params=params),
+                "Bybit copy trading",
+            )
+            if data is None:
                 return traders
 
-            data = response.json()
             result = data.get("result", {})
             leader_list = result.get("list", []) if isinstance(result, dict) else []
 
-            for i, item in enumerate(leader_list[:limit]):
+            for rank, item in enumerate(leader_list[:limit], 1):
                 try:
                     trader = TopTrader(
-                        uid=str(item.get("leaderMark", item.get("leaderId", ""))),
-                        nickname=item.get("nickName", f"Bybit Master #{i+1}"),
+                        uid=str(_first_of(item, _BYBIT_UID, "")),
+                        nickname=item.get("nickName", f"Bybit Master #{rank}"),
                         exchange="BYBIT",
-                        roi_7d=Decimal(str(item.get("roi7D", item.get("roi7d", 0)))),
-                        roi_30d=Decimal(str(item.get("roi30D", item.get("roi30d", 0)))),
-                        roi_90d=Decimal(str(item.get("roi90D", 0))),
-                        pnl_7d=Decimal(str(item.get("pnl7D", item.get("pnl7d", 0)))),
-                        pnl_30d=Decimal(str(item.get("pnl30D", 0))),
-                        pnl_total=Decimal(str(item.get("totalPnl", 0))),
-                        win_rate=Decimal(str(item.get("winRate", 0))) * 100 if float(item.get("winRate", 0)) <= 1 else Decimal(str(item.get("winRate", 0))),
+                        roi_7d=_dec(_first_of(item, _BYBIT_ROI_7D, 0)),
+                        roi_30d=_dec(_first_of(item, _BYBIT_ROI_30D, 0)),
+                        roi_90d=_dec(item.get("roi90D", 0)),
+                        pnl_7d=_dec(_first_of(item, _BYBIT_PNL_7D, 0)),
+                        pnl_30d=_dec(item.get("pnl30D", 0)),
+                        pnl_total=_dec(item.get("totalPnl", 0)),
+                        win_rate=_to_percent(_dec(item.get("winRate", 0))),
                         total_trades=int(item.get("totalTrades", 0)),
-                        followers_count=int(item.get("followerNum", item.get("currentFollowerNum", 0))),
-                        rank=i + 1
+                        followers_count=int(_first_of(item, _BYBIT_FOLLOWERS, 0)),
+                        rank=rank
                     )
                     traders.append(trader)
-                except Exception as e:
+                except _ROW_ERRORS as e:
                     logger.warning(f"Error parsing Bybit trader: {e}")
 
             logger.info(f"Fetched {len(traders)} traders from Bybit copy trading")
@@ -235,39 +423,40 @@ class ExchangeLeaderboardService:
                 "sort": "WEEK_ROI"  # Sort by 7-day ROI
             }
 
-            response = await self.client.get(url, params=params)
-
-            if response.status_code != 200:
-                logger.warning(f"Bitget copy trading API returned {response.status_code}")
+            data = await self._cached_json(
+                url, params, self.LIST_CACHE_TTL,
+                lambda: self.client.get(url, params=params),
+                "Bitget copy trading",
+            )
+            if data is None:
                 return traders
 
-            data = response.json()
             trader_list = data.get("data", {}).get("list", [])
 
-            for i, item in enumerate(trader_list[:limit]):
+            for rank, item in enumerate(trader_list[:limit], 1):
                 try:
                     # Bitget returns ROI as decimal (0.15 = 15%)
-                    roi_7d = Decimal(str(item.get("weekRoi", item.get("roiWeek", 0)))) * 100
-                    roi_30d = Decimal(str(item.get("monthRoi", item.get("roiMonth", 0)))) * 100
-                    win_rate = Decimal(str(item.get("winRate", 0))) * 100 if float(item.get("winRate", 0)) <= 1 else Decimal(str(item.get("winRate", 0)))
+                    roi_7d = _dec(_first_of(item, _BITGET_ROI_7D, 0)) * _HUNDRED
+                    roi_30d = _dec(_first_of(item, _BITGET_ROI_30D, 0)) * _HUNDRED
+                    win_rate = _to_percent(_dec(item.get("winRate", 0)))
 
                     trader = TopTrader(
-                        uid=str(item.get("traderUid", item.get("traderId", ""))),
-                        nickname=item.get("traderName", item.get("nickName", f"Bitget Master #{i+1}")),
+                        uid=str(_first_of(item, _BITGET_UID, "")),
+                        nickname=_first_of(item, _BITGET_NAME) or f"Bitget Master #{rank}",
                         exchange="BITGET",
                         roi_7d=roi_7d,
                         roi_30d=roi_30d,
-                        roi_90d=Decimal(str(item.get("totalRoi", 0))) * 100,
-                        pnl_7d=Decimal(str(item.get("weekPnl", item.get("pnlWeek", 0)))),
-                        pnl_30d=Decimal(str(item.get("monthPnl", 0))),
-                        pnl_total=Decimal(str(item.get("totalPnl", 0))),
+                        roi_90d=_dec(item.get("totalRoi", 0)) * _HUNDRED,
+                        pnl_7d=_dec(_first_of(item, _BITGET_PNL_7D, 0)),
+                        pnl_30d=_dec(item.get("monthPnl", 0)),
+                        pnl_total=_dec(item.get("totalPnl", 0)),
                         win_rate=win_rate,
-                        total_trades=int(item.get("totalTrade", item.get("tradeCount", 0))),
-                        followers_count=int(item.get("followerCount", item.get("copyCount", 0))),
-                        rank=i + 1
+                        total_trades=int(_first_of(item, _BITGET_TRADES, 0)),
+                        followers_count=int(_first_of(item, _BITGET_FOLLOWERS, 0)),
+                        rank=rank
                     )
                     traders.append(trader)
-                except Exception as e:
+                except _ROW_ERRORS as e:
                     logger.warning(f"Error parsing Bitget trader: {e}")
 
             logger.info(f"Fetched {len(traders)} traders from Bitget copy trading")
@@ -281,99 +470,127 @@ class ExchangeLeaderboardService:
         """
         Sync top traders to database as whales.
         Creates new whales or updates existing ones.
+
+        Whales and their stats are each written with one bulk
+        INSERT ... ON CONFLICT DO UPDATE, in a single transaction.
         """
-        synced_count = 0
+        whale_rows: dict[str, dict[str, Any]] = {}
+        stats_rows: dict[str, dict[str, Any]] = {}
+
+        for trader in traders:
+            # Generate a unique wallet address for exchange traders
+            # Format: exchange_uid (used for identification)
+            address_prefix, tags = _exchange_keys(trader.exchange)
+            wallet_address = address_prefix + trader.uid
+
+            # Calculate score based on ROI (0-100 scale)
+            # Higher ROI = higher score, capped at 100
+            roi_score = min(100, max(0, int(50 + float(trader.roi_7d) * 2)))
+
+            # Estimate win_rate from ROI (rough approximation)
+            # Positive ROI suggests win_rate > 50%
+            estimated_win_rate = min(_WIN_RATE_MAX, max(_WIN_RATE_MIN,
+                _WIN_RATE_BASE + trader.roi_7d / _WIN_RATE_ROI_STEP))
+
+            # Estimate total_trades from followers (more followers = more experienced)
+            estimated_trades = max(50, trader.followers_count * 2 + trader.rank * 3)
+
+            # Keyed by address: a repeated trader keeps its last entry, and
+            # one upsert statement cannot touch the same row twice
+            whale_rows[wallet_address] = {
+                "wallet_address": wallet_address,
+                "name": trader.nickname,
+                "chain": WhaleChain.ETHEREUM,  # Default, not relevant for CEX traders
+                "is_active": True,
+                "is_public": True,
+                "score": roi_score,
+                "tags": tags,
+            }
+            stats_rows[wallet_address] = {
+                "win_rate": estimated_win_rate,
+                "profit_7d": trader.pnl_7d,
+                "profit_30d": trader.pnl_30d if trader.pnl_30d else trader.pnl_7d * 3,
+                "profit_90d": trader.roi_90d if trader.roi_90d else trader.roi_7d * 2,
+                "total_profit_usd": trader.pnl_total if trader.pnl_total else trader.pnl_7d * 10,
+                "total_trades": trader.total_trades if trader.total_trades else estimated_trades,
+                "avg_profit_percent": trader.roi_7d,
+            }
 
-        async with get_db_context() as db:
-            for trader in traders:
-                try:
-                    # Generate a unique wallet address for exchange traders
-                    # Format: exchange_uid (used for identification)
-                    wallet_address = f"{trader.exchange.lower()}_{trader.uid}"
+        if not whale_rows:
+            return 0
 
-                    # Check if whale exists
-                    result = await db.execute(
-                        select(Whale).where(Whale.wallet_address == wallet_address)
-                    )
-                    existing_whale = result.scalar_one_or_none()
-
-                    # Calculate score based on ROI (0-100 scale)
-                    # Higher ROI = higher score, capped at 100
-                    roi_score = min(100, max(0, int(50 + float(trader.roi_7d) * 2)))
-
-                    # Estimate win_rate from ROI (rough approximation)
-                    # Positive ROI suggests win_rate > 50%
-                    estimated_win_rate = min(Decimal("85"), max(Decimal("45"),
-                        Decimal("55") + trader.roi_7d / Decimal("5")))
-
-                    if existing_whale:
-                        # Update existing whale
-                        existing_whale.name = trader.nickname
-                        existing_whale.tags = f"{trader.exchange},TOP_TRADER,LEADERBOARD"
-                        existing_whale.score = roi_score
-                        whale_id = existing_whale.id
-                    else:
-                        # Create new whale
-                        whale = Whale(
-                            wallet_address=wallet_address,
-                            name=trader.nickname,
-                            chain=WhaleChain.ETHEREUM,  # Default, not relevant for CEX traders
-                            is_active=True,
-                            is_public=True,
-                            score=roi_score,
-                            tags=f"{trader.exchange},TOP_TRADER,LEADERBOARD",
-                        )
-                        db.add(whale)
-                        await db.flush()
-                        whale_id = whale.id
-
-                    # Update or create whale stats
-                    stats_result = await db.execute(
-                        select(WhaleStats).where(WhaleStats.whale_id == whale_id)
-                    )
-                    existing_stats = stats_result.scalar_one_or_none()
-
-                    # Estimate total_trades from followers (more followers = more experienced)
-                    estimated_trades = max(50, trader.followers_count * 2 + trader.rank * 3)
-
-                    if existing_stats:
-                        existing_stats.win_rate = estimated_win_rate
-                        existing_stats.profit_7d = trader.pnl_7d
-                        existing_stats.profit_30d = trader.pnl_30d if trader.pnl_30d else trader.pnl_7d * 3
-                        existing_stats.profit_90d = trader.roi_90d if trader.roi_90d else trader.roi_7d * 2
-                        existing_stats.total_profit_usd = trader.pnl_total if trader.pnl_total else trader.pnl_7d * 10
-                        existing_stats.total_trades = trader.total_trades if trader.total_trades else estimated_trades
-                        existing_stats.avg_profit_percent = trader.roi_7d
-                    else:
-                        stats = WhaleStats(
-                            whale_id=whale_id,
-                            win_rate=estimated_win_rate,
-                            profit_7d=trader.pnl_7d,
-                            profit_30d=trader.pnl_30d if trader.pnl_30d else trader.pnl_7d * 3,
-                            profit_90d=trader.roi_90d if trader.roi_90d else trader.roi_7d * 2,
-                            total_profit_usd=trader.pnl_total if trader.pnl_total else trader.pnl_7d * 10,
-                            total_trades=trader.total_trades if trader.total_trades else estimated_trades,
-                            avg_profit_percent=trader.roi_7d,
-                        )
-                        db.add(stats)
-
-                    synced_count += 1
-
-                except Exception as e:
-                    logger.error(f"Error syncing trader {trader.nickname}: {e}")
-
-            await db.commit()
+        whale_stmt = insert(Whale).values(list(whale_rows.values()))
+        whale_stmt = whale_stmt.on_conflict_do_update(
+            index_elements=["wallet_address"],
+            set_={
+                "name": whale_stmt.excluded.name,
+                "tags": whale_stmt.excluded.tags,
+                "score": whale_stmt.excluded.score,
+                "updated_at": func.now(),
+            },
+        ).returning(Whale.id, Whale.wallet_address)
 
+        async with get_db_context() as db:
+            try:
+                result = await db.execute(whale_stmt)
+                whale_ids = {wallet_address: whale_id for whale_id, wallet_address in result.all()}
+
+                stats_values = [
+                    {"whale_id": whale_ids[wallet_address], **row}
+                    for wallet_address, row in stats_rows.items()
+                    if wallet_address in whale_ids
+                ]
+                stats_stmt = insert(WhaleStats).values(stats_values)
+                stats_stmt = stats_stmt.on_conflict_do_update(
+                    index_elements=["whale_id"],
+                    set_={
+                        **{column: stats_stmt.excluded[column] for column in _STATS_COLUMNS},
+                        "updated_at": func.now(),
+                    },
+                )
+                await db.execute(stats_stmt)
+                await db.commit()
+            except Exception as e:
+                logger.error(f"Error syncing traders: {e}")
+                await db.rollback()
+                return 0
+
+        synced_count = len(whale_ids)
         logger.info(f"Synced {synced_count} traders to database")
         return synced_count
 
 
+# Singleton instance
+_service: Optional[ExchangeLeaderboardService] = None
+
+
+def get_leaderboard_service() -> ExchangeLeaderboardService:
+    """
+    Get singleton ExchangeLeaderboardService instance.
+
+    Sharing it keeps the HTTP connection pool (and response cache) warm
+    across periodic syncs instead of reconnecting to every exchange.
+    """
+    global _service
+    if _service is None or _service.client.is_closed:
+        _service = ExchangeLeaderboardService()
+    return _service
+
+
+async def close_leaderboard_service() -> None:
+    """Close the shared service's HTTP client (call on worker shutdown)."""
+    global _service
+    if _service is not None:
+        await _service.close()
+        _service = None
+
+
 async def sync_exchange_leaderboards():
     """
     Main function to sync exchange leaderboards to database.
     Should be called periodically (e.g., every 5 minutes).
     """
-    service = ExchangeLeaderboardService()
+    service = get_leaderboard_service()
 
     try:
         # Fetch top traders from all exchanges
@@ -389,10 +606,14 @@ async def sync_exchange_leaderboards():
         logger.error(f"Leaderboard sync failed: {e}")
         return 0
 
+
+async def _main():
+    try:
+        await sync_exchange_leaderboards()
     finally:
-        await service.close()
+        await close_leaderboard_service()
 
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
-    asyncio.run(sync_exchange_leaderboards())
+    asyncio.run(_main())
@@ -2,6 +2,8 @@
 Exchange Integration Module
 """
 
+from typing import Callable
+
 from app.services.exchanges.base import BaseExchange, OrderResult, Balance, Position as ExchangePosition, PositionSide
 from app.services.exchanges.binance_executor import BinanceExecutor
 from app.services.exchanges.okx_executor import OKXExecutor
@@ -28,6 +30,14 @@ __all__ = [
 ]
 
 
+# Exchange name -> executor constructor (api_key, api_secret, passphrase, testnet)
+_EXECUTOR_FACTORIES: dict[str, Callable[[str, str, str | None, bool], BaseExchange]] = {
+    "binance": lambda key, secret, passphrase, testnet: BinanceExecutor(key, secret, testnet=testnet),
+    "okx": lambda key, secret, passphrase, testnet: OKXExecutor(key, secret, passphrase or "", testnet=testnet),
+    "bybit": lambda key, secret, passphrase, testnet: BybitExecutor(key, secret, testnet=testnet),
+}
+
+
 def get_exchange_executor(
     exchange_name: str,
     api_key: str,
@@ -56,24 +66,21 @@ def get_exchange_executor(
     """
     exchange_name = exchange_name.lower()
 
+    factory = _EXECUTOR_FACTORIES.get(exchange_name)
+    if factory is None:
+        raise ValueError(f"Unsupported exchange: {exchange_name}")
+
+    breaker = get_circuit_breaker(exchange_name)
+
     # Check circuit breaker before creating executor
-    if check_circuit_breaker:
-        breaker = get_circuit_breaker(exchange_name)
-        if not breaker.can_execute():
-            raise CircuitOpenError(
-                exchange_name,
-                breaker.get_time_remaining()
-            )
+    if check_circuit_breaker and not breaker.can_execute():
+        raise CircuitOpenError(
+            exchange_name,
+            breaker.get_time_remaining()
+        )
 
-    if exchange_name == "binance":
-        executor = BinanceExecutor(api_key, api_secret, testnet=testnet)
-    elif exchange_name == "okx":
-        executor = OKXExecutor(api_key, api_secret, passphrase or "", testnet=testnet)
-    elif exchange_name == "bybit":
-        executor = BybitExecutor(api_key, api_secret, testnet=testnet)
-    else:
-        raise ValueError(f"Unsupported exchange: {exchange_name}")
+    executor = factory(api_key, api_secret, passphrase, testnet)
 
     # Attach circuit breaker to executor for recording success/failure
-    executor._circuit_breaker = get_circuit_breaker(exchange_name)
+    executor._circuit_breaker = breaker
     return executor
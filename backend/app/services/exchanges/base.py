@@ -5,11 +5,15 @@ Abstract base class for all exchange integrations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from decimal import Decimal
+from decimal import ROUND_DOWN, Decimal
 from enum import Enum
 from typing import Any
 
 
+# Default step/tick size when a subclass has no exchange-specific rule
+_DEFAULT_STEP = Decimal("0.00000001")
+
+
 class OrderSide(str, Enum):
     BUY = "BUY"
     SELL = "SELL"
@@ -39,7 +43,7 @@ class OrderStatus(str, Enum):
     PENDING = "PENDING"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Balance:
     """Account balance for a specific asset."""
 
@@ -58,7 +62,7 @@ class Balance:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OrderResult:
     """Result of an order execution."""
 
@@ -92,7 +96,7 @@ class OrderResult:
         return (self.filled_quantity / self.quantity) * 100
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Position:
     """Open position information."""
 
@@ -351,8 +355,8 @@ class BaseExchange(ABC):
         Round quantity to valid step size for the symbol.
         Override in subclasses with exchange-specific logic.
         """
-        # Default: round to 8 decimal places
-        return quantity.quantize(Decimal("0.00000001"))
+        # Default: truncate to 8 decimal places (never round up past the balance)
+        return quantity.quantize(_DEFAULT_STEP, rounding=ROUND_DOWN)
 
     def round_price(self, symbol: str, price: Decimal) -> Decimal:
         """
@@ -360,4 +364,4 @@ class BaseExchange(ABC):
         Override in subclasses with exchange-specific logic.
         """
         # Default: round to 8 decimal places
-        return price.quantize(Decimal("0.00000001"))
+        return price.quantize(_DEFAULT_STEP)
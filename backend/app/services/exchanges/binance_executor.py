@@ -6,7 +6,7 @@ Supports both Spot and Futures (USDT-M) trading
 import asyncio
 import logging
 import time
-from decimal import Decimal
+from decimal import ROUND_DOWN, Decimal
 from typing import Any
 
 from binance import AsyncClient, BinanceSocketManager
@@ -25,10 +25,17 @@ from app.services.exchanges.base import (
 
 logger = logging.getLogger(__name__)
 
+# Fallback precision when no market/symbol rules are cached
+_QUANTITY_STEP = Decimal("0.00001")
+_PRICE_TICK = Decimal("0.01")
+
 
 class BinanceExecutor(BaseExchange):
     """Binance exchange executor for spot and futures trading."""
 
+    # Minimum interval between exchange-info refetches on a symbol miss (seconds)
+    SYMBOL_INFO_REFRESH_INTERVAL = 300.0
+
     def __init__(
         self,
         api_key: str,
@@ -39,6 +46,9 @@ class BinanceExecutor(BaseExchange):
         self._client: AsyncClient | None = None
         self._symbol_info_cache: dict[str, dict] = {}
         self._futures_symbol_info_cache: dict[str, dict] = {}
+        # Monotonic time of the last exchange-info fetch triggered by a miss
+        self._symbol_info_fetched_at = float("-inf")
+        self._symbol_info_lock = asyncio.Lock()
 
     @property
     def name(self) -> str:
@@ -530,22 +540,34 @@ class BinanceExecutor(BaseExchange):
         """Get symbol trading rules."""
         symbol = self.normalize_symbol(symbol)
 
-        # Check cache first
-        if symbol in self._symbol_info_cache:
-            return self._symbol_info_cache[symbol]
-
-        # Fetch from API
-        client = self._ensure_client()
-        try:
-            info = await client.get_exchange_info()
-            for s in info.get("symbols", []):
+        # Check cache first (futures-only symbols live in the futures cache)
+        info = self._symbol_info_cache.get(symbol) or self._futures_symbol_info_cache.get(symbol)
+        if info is not None:
+            return info
+
+        # Refetch the full exchange info at most once per interval: concurrent
+        # misses wait for one fetch, and unknown symbols don't refetch per call
+        async with self._symbol_info_lock:
+            info = self._symbol_info_cache.get(symbol) or self._futures_symbol_info_cache.get(symbol)
+            if info is not None:
+                return info
+
+            if time.monotonic() - self._symbol_info_fetched_at < self.SYMBOL_INFO_REFRESH_INTERVAL:
+                return None
+
+            client = self._ensure_client()
+            try:
+                exchange_info = await client.get_exchange_info()
+            except BinanceAPIException:
+                # No refetch window on failure: the next call retries
+                return None
+
+            for s in exchange_info.get("symbols", []):
                 self._symbol_info_cache[s["symbol"]] = s
-                if s["symbol"] == symbol:
-                    return s
-        except BinanceAPIException:
-            pass
+            # Only a successful fetch starts the no-refetch window
+            self._symbol_info_fetched_at = time.monotonic()
 
-        return None
+        return self._symbol_info_cache.get(symbol)
 
     # ==================== UTILITY ====================
 
@@ -557,7 +579,7 @@ class BinanceExecutor(BaseExchange):
         if not info:
             logger.warning(f"Symbol info not cached for {symbol}, using default precision")
             # Default precision if info not available
-            return quantity.quantize(Decimal("0.00001"))
+            return quantity.quantize(_QUANTITY_STEP, rounding=ROUND_DOWN)
 
         for f in info.get("filters", []):
             if f["filterType"] == "LOT_SIZE":
@@ -566,7 +588,7 @@ class BinanceExecutor(BaseExchange):
                     return (quantity // step_size) * step_size
 
         # Default precision
-        return quantity.quantize(Decimal("0.00001"))
+        return quantity.quantize(_QUANTITY_STEP, rounding=ROUND_DOWN)
 
     def round_price(self, symbol: str, price: Decimal) -> Decimal:
         """Round price to valid tick size."""
@@ -581,4 +603,4 @@ class BinanceExecutor(BaseExchange):
                         return (price // tick_size) * tick_size
 
         # Default precision
-        return price.quantize(Decimal("0.01"))
+        return price.quantize(_PRICE_TICK)
@@ -4,7 +4,7 @@ Supports both Spot and Perpetual Futures trading via CCXT
 """
 
 import time
-from decimal import Decimal
+from decimal import ROUND_DOWN, Decimal
 from typing import Any
 
 import ccxt.async_support as ccxt
@@ -21,6 +21,11 @@ from app.services.exchanges.base import (
 )
 
 
+# Fallback precision when no market/symbol rules are cached
+_QUANTITY_STEP = Decimal("0.00001")
+_PRICE_TICK = Decimal("0.01")
+
+
 class BybitExecutor(BaseExchange):
     """Bybit exchange executor for spot and futures trading."""
 
@@ -474,7 +479,7 @@ class BybitExecutor(BaseExchange):
             if precision:
                 return Decimal(str(round(float(quantity), precision)))
 
-        return quantity.quantize(Decimal("0.00001"))
+        return quantity.quantize(_QUANTITY_STEP, rounding=ROUND_DOWN)
 
     def round_price(self, symbol: str, price: Decimal) -> Decimal:
         """Round price to valid tick size."""
@@ -486,4 +491,4 @@ class BybitExecutor(BaseExchange):
             if precision:
                 return Decimal(str(round(float(price), precision)))
 
-        return price.quantize(Decimal("0.01"))
+        return price.quantize(_PRICE_TICK)
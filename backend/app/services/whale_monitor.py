@@ -20,6 +20,8 @@ from app.config import get_settings
 from app.database import get_db_context
 from app.models.signal import SignalAction, SignalConfidence, SignalStatus, WhaleSignal
 from app.models.whale import Whale, WhaleChain
+from app.services.dex_parsers import RouterRegistry, SwapInfo
+from app.services.dex_parsers._filter import SwapPrefilter
 from app.services.dex_parsers.uniswap import UniswapParser
 from app.services.dex_parsers.pancakeswap import PancakeSwapParser
 from app.services.dex_parsers.sushiswap import SushiSwapParser
@@ -87,6 +89,12 @@ class WhaleMonitor:
         self._bsc_pancake_parser: PancakeSwapParser | None = None
         self._bsc_sushi_parser: SushiSwapParser | None = None
 
+        # Router address -> parser lookup per chain
+        self._registries: dict[WhaleChain, RouterRegistry] = {}
+
+        # Router/selector pre-filters run before any ABI decoding
+        self._prefilters: dict[WhaleChain, SwapPrefilter] = {}
+
     async def initialize(self) -> None:
         """Initialize connections and load monitored wallets."""
         logger.info("Initializing Whale Monitor...")
@@ -126,6 +134,19 @@ class WhaleMonitor:
             self._bsc_pancake_parser = PancakeSwapParser(self.bsc_web3)
             self._bsc_sushi_parser = SushiSwapParser(self.bsc_web3, chain="bsc")
 
+        self._registries = {
+            WhaleChain.ETHEREUM: RouterRegistry(
+                p for p in (self._eth_uniswap_parser, self._eth_sushi_parser) if p
+            ),
+            WhaleChain.BSC: RouterRegistry(
+                p for p in (self._bsc_pancake_parser, self._bsc_sushi_parser) if p
+            ),
+        }
+        self._prefilters = {
+            chain: SwapPrefilter(registry.routers, registry.selectors)
+            for chain, registry in self._registries.items()
+        }
+
         # Load monitored wallets from database
         await self._load_monitored_wallets()
 
@@ -212,11 +233,17 @@ class WhaleMonitor:
         try:
             block = await web3.eth.get_block("latest", full_transactions=True)
 
-            for tx in block.get("transactions", []):
-                sender = tx.get("from", "").lower()
+            whale_txs = [
+                tx for tx in block.get("transactions", [])
+                if tx.get("from", "").lower() in self._monitored_wallets
+            ]
 
-                if sender in self._monitored_wallets:
-                    await self._process_transaction(chain, tx)
+            swap_txs = self._prefilters[chain].filter(whale_txs)
+            if not swap_txs:
+                return
+
+            for tx, swap_info in await self._parse_swaps(chain, swap_txs):
+                await self._process_transaction(chain, tx, swap_info)
 
         except Exception as e:
             logger.error(f"Error getting block: {e}")
@@ -225,20 +252,15 @@ class WhaleMonitor:
         self,
         chain: WhaleChain,
         tx: dict[str, Any],
+        swap_info: SwapInfo,
     ) -> None:
-        """Process a transaction from a monitored wallet."""
+        """Process a parsed swap from a monitored wallet."""
         sender = tx.get("from", "").lower()
         wallet = self._monitored_wallets.get(sender)
 
         if not wallet:
             return
 
-        # Parse the transaction using appropriate parser
-        swap_info = await self._parse_swap(chain, tx)
-
-        if not swap_info:
-            return  # Not a swap transaction
-
         # Check minimum size
         if swap_info.amount_usd < MIN_SIGNAL_SIZE_USD:
             return
@@ -270,39 +292,22 @@ class WhaleMonitor:
             # Publish to Redis for real-time updates
             await self._publish_signal(signal)
 
-    async def _parse_swap(
+    async def _parse_swaps(
         self,
         chain: WhaleChain,
-        tx: dict[str, Any],
-    ) -> Any | None:
-        """Parse a transaction using the appropriate DEX parser."""
-        if chain == WhaleChain.ETHEREUM:
-            # Try Uniswap first
-            if self._eth_uniswap_parser:
-                result = self._eth_uniswap_parser.parse_transaction(tx)
-                if result:
-                    return result
-
-            # Try SushiSwap
-            if self._eth_sushi_parser:
-                result = self._eth_sushi_parser.parse_transaction(tx)
-                if result:
-                    return result
-
-        elif chain == WhaleChain.BSC:
-            # Try PancakeSwap first
-            if self._bsc_pancake_parser:
-                result = self._bsc_pancake_parser.parse_transaction(tx)
-                if result:
-                    return result
-
-            # Try SushiSwap
-            if self._bsc_sushi_parser:
-                result = self._bsc_sushi_parser.parse_transaction(tx)
-                if result:
-                    return result
-
-        return None
+        txs: list[dict[str, Any]],
+    ) -> list[tuple[dict[str, Any], SwapInfo]]:
+        """
+        Parse a block's candidate swaps with the DEX parsers registered for their routers.
+
+        Each swap is decoded once and token metadata for the whole batch is
+        fetched up front, so the parse itself never blocks on RPC.
+        """
+        registry = self._registries.get(chain)
+        if not registry:
+            return []
+
+        return await registry.parse_block(txs)
 
     def _get_cex_symbol(self, token: str) -> str | None:
         """Get CEX trading symbol for a token."""
@@ -316,13 +321,14 @@ class WhaleMonitor:
     ) -> SignalConfidence:
         """Calculate signal confidence based on various factors."""
         score = Decimal("50")
+        amount_usd = swap_info.amount_usd
 
         # Size-based scoring
-        if swap_info.amount_usd >= Decimal("100000"):
+        if amount_usd >= Decimal("100000"):
             score += Decimal("30")
-        elif swap_info.amount_usd >= Decimal("50000"):
+        elif amount_usd >= Decimal("50000"):
             score += Decimal("20")
-        elif swap_info.amount_usd >= Decimal("25000"):
+        elif amount_usd >= Decimal("25000"):
             score += Decimal("10")
 
         # TODO: Add whale historical performance scoring
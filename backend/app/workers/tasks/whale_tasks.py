@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 from decimal import Decimal
 
 import redis
+from celery.signals import worker_process_shutdown
 from sqlalchemy import select, func, and_, text
 
 from app.database import get_sync_db
@@ -407,6 +408,19 @@ def run_async(coro):
     return loop.run_until_complete(coro)
 
 
+@worker_process_shutdown.connect
+def close_leaderboard_client(**kwargs):
+    """
+    Close the shared leaderboard HTTP client when the worker process exits.
+    Syncs reuse one client (and its warm connections) between runs.
+    """
+    try:
+        from app.services.exchange_leaderboard import close_leaderboard_service
+        run_async(close_leaderboard_service())
+    except Exception as e:
+        logger.warning(f"Failed to close leaderboard client: {e}")
+
+
 @celery_app.task
 def generate_trader_signals():
     """
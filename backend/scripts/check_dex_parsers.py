@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Smoke check for the DEX parsers' prebuilt ABI decoders.
+Imports the parser package (which builds every decoder at import time) and
+round-trips sample calldata through each decoder against eth_abi.decode().
+
+Run in the backend container: python scripts/check_dex_parsers.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from eth_abi import decode, encode
+
+import app.services.dex_parsers  # noqa: F401  (fails here if a decoder cannot be built)
+from app.services.dex_parsers import _token_cache, pancakeswap, uniswap
+
+TOKEN_A = "0x" + "11" * 20
+TOKEN_B = "0x" + "22" * 20
+RECIPIENT = "0x" + "33" * 20
+
+# (module, decoder name, ABI types, sample values)
+CASES = [
+    (_token_cache, "_decode_string", ("string",), ("USDC",)),
+    (_token_cache, "_decode_uint8", ("uint8",), (6,)),
+    (
+        uniswap, "_decode_v2_eth_for_tokens",
+        ("uint256", "address[]", "address", "uint256"),
+        (1, [TOKEN_A, TOKEN_B], RECIPIENT, 2),
+    ),
+    (
+        uniswap, "_decode_v2_tokens_for_x",
+        ("uint256", "uint256", "address[]", "address", "uint256"),
+        (1, 2, [TOKEN_A, TOKEN_B], RECIPIENT, 3),
+    ),
+    (
+        uniswap, "_decode_v3_exact_input_single",
+        ("address", "address", "uint24", "address", "uint256", "uint256", "uint256", "uint160"),
+        (TOKEN_A, TOKEN_B, 3000, RECIPIENT, 1, 2, 3, 0),
+    ),
+    (
+        uniswap, "_decode_v3_exact_input_single_02",
+        ("address", "address", "uint24", "address", "uint256", "uint256", "uint160"),
+        (TOKEN_A, TOKEN_B, 500, RECIPIENT, 1, 2, 0),
+    ),
+    (
+        pancakeswap, "_decode_v3_single",
+        ("address", "address", "uint24", "address", "uint256", "uint256", "uint160"),
+        (TOKEN_A, TOKEN_B, 2500, RECIPIENT, 1, 2, 0),
+    ),
+    (
+        pancakeswap, "_decode_v3_exact_input",
+        ("(bytes,address,uint256,uint256)",),
+        ((bytes.fromhex(TOKEN_A[2:] + "0009c4" + TOKEN_B[2:]), RECIPIENT, 1, 2),),
+    ),
+]
+
+
+def main() -> int:
+    failures = 0
+    for module, name, types, values in CASES:
+        data = encode(types, values)
+        try:
+            got = getattr(module, name)(data)
+            expected = decode(types, data)
+            ok = got == expected
+        except Exception as e:
+            got, ok = e, False
+
+        if ok:
+            print(f"✅ {module.__name__}.{name}")
+        else:
+            failures += 1
+            print(f"❌ {module.__name__}.{name}: {got!r}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())